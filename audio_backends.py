@@ -0,0 +1,147 @@
+"""Ways to get an alarm sound out of the speakers, for audio_service.
+
+Every backend has the same small surface:
+
+    name, extensions        registry name; file types it plays (None = any)
+    available()             cheap check, never imports the heavy library
+    load(path)              decode/read into memory; runs on the audio thread
+    start(handle, started)  begin playback without blocking; calls started()
+                            once the sound has been handed to the output
+    output_latency_ms()     known buffering after that point, or None
+
+PygameBackend decodes ogg/mp3/wav through SDL_mixer. WaveBackend plays WAV
+files with no SDL at all: winsound on Windows, otherwise an ALSA/PulseAudio
+player (aplay, paplay) fed over a pipe. RecordingBackend plays nothing and
+just records what it was asked to do, for tests and machines without sound.
+"""
+import importlib.util
+import io
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import wave
+
+# A small mixer buffer keeps output latency down (512 frames ~ 12 ms)
+MIXER_FREQUENCY = 44100
+MIXER_BUFFER = 512
+
+
+class PygameBackend:
+    name = "pygame"
+    extensions = (".ogg", ".wav", ".mp3")
+
+    def __init__(self):
+        self.mixer = None
+
+    def available(self):
+        return importlib.util.find_spec("pygame") is not None
+
+    def _init_mixer(self):
+        if self.mixer is None:
+            # pygame drags in SDL, so it's only loaded once a sound is needed
+            os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+            import pygame
+            if not pygame.mixer.get_init():
+                pygame.mixer.pre_init(MIXER_FREQUENCY, -16, 2, MIXER_BUFFER)
+                pygame.mixer.init()
+            self.mixer = pygame.mixer
+        return self.mixer
+
+    def load(self, path):
+        return self._init_mixer().Sound(path)
+
+    def start(self, sound, started):
+        if sound.play() is None:
+            raise RuntimeError("no free mixer channel")
+        started()
+
+    def output_latency_ms(self):
+        init = self.mixer.get_init() if self.mixer else None
+        return MIXER_BUFFER / init[0] * 1000 if init else None
+
+
+class WaveBackend:
+    name = "wave"
+    extensions = (".wav",)
+    # Tried in order; each reads a WAV stream from stdin
+    PLAYERS = (("aplay", "-q", "-"), ("paplay",))
+
+    def __init__(self):
+        self.command = None
+
+    def available(self):
+        if sys.platform == "win32":
+            return importlib.util.find_spec("winsound") is not None
+        for command in self.PLAYERS:
+            if shutil.which(command[0]):
+                self.command = command
+                return True
+        return False
+
+    def load(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        # Fail now on anything that isn't a readable WAV rather than at the deadline
+        with wave.open(io.BytesIO(data)) as w:
+            w.getparams()
+        return data
+
+    def start(self, data, started):
+        # Both ways of playing block until the sound ends, so give them a thread
+        threading.Thread(target=self._play, args=(data, started), name="audio-wave", daemon=True).start()
+
+    def _play(self, data, started):
+        try:
+            if sys.platform == "win32":
+                import winsound
+                # winsound can't play from memory asynchronously; this thread waits instead
+                started()
+                winsound.PlaySound(data, winsound.SND_MEMORY | winsound.SND_NODEFAULT)
+            else:
+                proc = subprocess.Popen(self.command, stdin=subprocess.PIPE,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                started()
+                proc.communicate(data)
+        except Exception as e:
+            print(f"Failed to play sound: {e}")
+
+    def output_latency_ms(self):
+        return None
+
+
+class RecordingBackend:
+    name = "null"
+    extensions = None
+
+    def __init__(self):
+        self.loaded = []
+        self.played = []
+
+    def available(self):
+        return True
+
+    def load(self, path):
+        self.loaded.append(path)
+        return path
+
+    def start(self, path, started):
+        self.played.append((path, time.perf_counter()))
+        started()
+
+    def output_latency_ms(self):
+        return 0.0
+
+
+BACKENDS = {backend.name: backend for backend in (PygameBackend, WaveBackend, RecordingBackend)}
+# "auto": the SDL-free player first, pygame for what it can't play, then silence
+AUTO_ORDER = ("wave", "pygame", "null")
+
+
+def backend_order(spec):
+    # "auto" or a comma-separated list of backend names, e.g. "pygame,null"
+    if not spec or spec == "auto":
+        return AUTO_ORDER
+    return tuple(name.strip() for name in spec.split(",") if name.strip())
@@ -0,0 +1,204 @@
+"""Countdown alarm sounds, loaded ahead of time and played without blocking.
+
+play_custom_sound() used to start the mixer and load the file on the GUI
+thread at the moment a countdown hit zero, from a path that only existed on
+one machine. AudioService looks sounds up under the app's data directory and
+decodes them on a background thread as soon as a countdown that will need one
+starts. The decoded sound stays in memory, so the deadline itself is one call
+into a player that is already set up, with no disk I/O. If a sound isn't ready
+when it's due, loading and playing it is queued on that same thread rather
+than done by the caller.
+
+How sounds are played is up to a backend (see audio_backends), picked per
+file type the first time a sound is loaded; neither the backends nor the
+libraries behind them are imported until then. TZC_AUDIO_BACKEND chooses the
+order ("auto" by default, or e.g. "pygame" or "wave,null").
+
+Every playback's trigger-to-playback latency is kept in `latencies`. Set
+TZC_AUDIO_REPORT to a file path (or "-" for stdout) to also get each one as
+a JSON line.
+"""
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+REPORT_ENV = "TZC_AUDIO_REPORT"
+BACKEND_ENV = "TZC_AUDIO_BACKEND"
+# Looked up with each extension in turn; WAV first as it needs no SDL
+DEFAULT_SOUND = "alarm"
+SOUND_EXTENSIONS = (".wav", ".ogg", ".mp3")
+# Playbacks remembered for latency_stats()
+LATENCY_HISTORY = 50
+
+
+def resolve_sound(name, sound_dir):
+    # Absolute paths are used as-is, anything else is looked up in sound_dir;
+    # a name without an extension tries the usual ones
+    if not name:
+        return None
+    path = name if os.path.isabs(name) else os.path.join(sound_dir, name)
+    candidates = [path] if os.path.splitext(path)[1] else [path + ext for ext in SOUND_EXTENSIONS]
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def sound_signature(path):
+    # What a failed load is remembered against: a missing sound that appears,
+    # or a broken one that is replaced, gets another try
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path, None)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+class AudioService:
+    """Background loader and low-latency player for alarm sounds.
+
+    prepare(name) resolves and decodes a sound on the worker thread; play(name)
+    starts it straight away if it is resident and otherwise hands the load and
+    play to the worker. Neither call touches the disk or blocks its caller.
+    `backends` is a list of backend names or instances to try in order.
+    """
+    def __init__(self, sound_dir, backends=None):
+        self.sound_dir = sound_dir
+        self.order = list(backends) if backends else None
+        self.backends = {}
+        self.sounds = {}
+        self.failed = {}
+        self.failed_on = {}
+        self.latencies = deque(maxlen=LATENCY_HISTORY)
+        self.jobs = queue.Queue()
+        self.thread = None
+
+    def prepare(self, name):
+        if name not in self.sounds:
+            self._submit(self._load, name)
+
+    def play(self, name, due=None):
+        # `due` is the time.time() the sound was meant for, to report lateness
+        triggered = time.perf_counter()
+        loaded = self.sounds.get(name)
+        if loaded is not None:
+            self._start(name, loaded, triggered, due)
+        else:
+            self._submit(self._load_and_play, name, triggered, due)
+
+    def latency_stats(self):
+        values = [entry["trigger_ms"] for entry in self.latencies]
+        if not values:
+            return None
+        return {"count": len(values), "last_ms": values[-1],
+                "mean_ms": sum(values) / len(values), "max_ms": max(values)}
+
+    def wait(self, timeout=None):
+        # Block until queued loads/plays are done (tests and benchmarks)
+        done = threading.Event()
+        self._submit(done.set)
+        return done.wait(timeout)
+
+    def backend_for(self, path):
+        # First backend in order that is installed and plays this file type
+        if self.order is None:
+            from audio_backends import backend_order
+            self.order = list(backend_order(os.environ.get(BACKEND_ENV)))
+        ext = os.path.splitext(path)[1].lower()
+        for entry in self.order:
+            backend = self._backend(entry)
+            if backend is not None and (backend.extensions is None or ext in backend.extensions):
+                return backend
+        return None
+
+    def _backend(self, entry):
+        if not isinstance(entry, str):
+            return entry
+        if entry not in self.backends:
+            from audio_backends import BACKENDS
+            cls = BACKENDS.get(entry)
+            backend = cls() if cls else None
+            self.backends[entry] = backend if backend is not None and backend.available() else None
+        return self.backends[entry]
+
+    def _submit(self, job, *args):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._work, name="audio", daemon=True)
+            self.thread.start()
+        self.jobs.put((job, args))
+
+    def _work(self):
+        while True:
+            job, args = self.jobs.get()
+            try:
+                job(*args)
+            except Exception as e:
+                print(f"Audio error: {e}")
+
+    def _load(self, name):
+        # Worker thread only
+        if name in self.sounds:
+            return self.sounds[name]
+        path = resolve_sound(name, self.sound_dir)
+        signature = sound_signature(path)
+        if name in self.failed and self.failed_on.get(name) == signature:
+            return None
+        try:
+            if path is None:
+                raise FileNotFoundError(f"no sound named {name!r} in {self.sound_dir}")
+            backend = self.backend_for(path)
+            if backend is None:
+                raise RuntimeError(f"no audio backend can play {path}")
+            if backend.name == "null" and self._backend(self.order[0]) is not backend:
+                print(f"No audio output available for {path}; the alarm will be silent")
+            loaded = self.sounds[name] = (backend, backend.load(path))
+            self.failed.pop(name, None)
+            self.failed_on.pop(name, None)
+            return loaded
+        except Exception as e:
+            # Reported once per version of the file; only a change to it is retried
+            self.failed[name] = str(e)
+            self.failed_on[name] = signature
+            print(f"Failed to load sound: {e}")
+            return None
+
+    def _load_and_play(self, name, triggered, due):
+        loaded = self._load(name)
+        if loaded is not None:
+            self._start(name, loaded, triggered, due)
+
+    def _start(self, name, loaded, triggered, due):
+        backend, handle = loaded
+        def started():
+            entry = {
+                "sound": name,
+                "backend": backend.name,
+                "trigger_ms": (time.perf_counter() - triggered) * 1000,
+                "late_ms": (time.time() - due) * 1000 if due is not None else None,
+                "buffer_ms": backend.output_latency_ms(),
+            }
+            self.latencies.append(entry)
+            self._report(entry)
+        try:
+            backend.start(handle, started)
+        except Exception as e:
+            print(f"Failed to play sound: {e}")
+
+    def _report(self, entry):
+        path = os.environ.get(REPORT_ENV)
+        if not path:
+            return
+        line = json.dumps(entry)
+        if path == "-":
+            print(line)
+            return
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError:
+            pass
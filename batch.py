@@ -0,0 +1,108 @@
+"""Convert many naive timestamps between two zones in one call.
+
+Accepted inputs:
+  * a list (or any iterable) of naive datetimes -> list of naive datetimes
+  * an array.array of naive epoch seconds ('q', 'l', 'd', ...) -> same typecode
+  * a NumPy datetime64 array -> datetime64 array in the same unit for
+    s/ms/us/ns inputs; day and calendar units (D, W, M, Y) come back as
+    datetime64[s], since a zone shift isn't a whole number of days
+
+Timestamps are wall-clock times in the source zone; ambiguous and skipped
+times resolve the same way engine.convert() does (pytz is_dst=False).
+"""
+import sys
+from array import array
+from bisect import bisect_right
+from datetime import timedelta
+
+from engine import convert_datetime, resolve_zone
+from transitions import DAY_SECONDS, EPOCH, ONE_SECOND, get_table
+
+
+def _fallback_shift(wall, src_tz, dst_tz):
+    # Outside the cached year range: let pytz work it out for this one value
+    result = convert_datetime(EPOCH + timedelta(seconds=wall), src_tz, dst_tz)
+    return int(result.offset_delta.total_seconds())
+
+
+def _shift_seconds(values, src_tz, dst_tz):
+    # Yields the destination offset minus the source offset for each wall time.
+    # Consecutive timestamps usually share a period, so remember the last hit
+    # and only bisect when a value leaves it.
+    src_table, dst_table = get_table(src_tz), get_table(dst_tz)
+    walls, src_offsets = src_table.walls, src_table.offsets
+    starts, dst_offsets = dst_table.starts, dst_table.offsets
+    n_walls, n_starts = len(walls), len(starts)
+    lo_w = hi_w = lo_u = hi_u = None
+    src_off = dst_off = 0
+    for wall in values:
+        if not src_table.covers_wall(wall):
+            yield _fallback_shift(wall, src_tz, dst_tz)
+            continue
+        if lo_w is None or not lo_w <= wall < hi_w:
+            i = max(bisect_right(walls, wall) - 1, 0)
+            lo_w = walls[i] if i else float('-inf')
+            hi_w = walls[i + 1] if i + 1 < n_walls else float('inf')
+            src_off = src_offsets[i]
+        utc = wall - src_off
+        if not dst_table.covers_utc(utc):
+            yield _fallback_shift(wall, src_tz, dst_tz)
+            continue
+        if lo_u is None or not lo_u <= utc < hi_u:
+            j = max(bisect_right(starts, utc) - 1, 0)
+            lo_u = starts[j] if j else float('-inf')
+            hi_u = starts[j + 1] if j + 1 < n_starts else float('inf')
+            dst_off = dst_offsets[j]
+        yield dst_off - src_off
+
+
+_TICKS_PER_SECOND = {'s': 1, 'ms': 10**3, 'us': 10**6, 'ns': 10**9}
+
+
+def _scaled(np, values, scale):
+    # Table entries reach back to year 1, which overflows int64 nanoseconds
+    floor = np.iinfo(np.int64).min // scale
+    return np.maximum(np.asarray(values, dtype=np.int64), floor) * scale
+
+
+def _convert_numpy(np, values, src_tz, dst_tz):
+    src_table, dst_table = get_table(src_tz), get_table(dst_tz)
+    unit, _ = np.datetime_data(values.dtype)
+    if unit not in _TICKS_PER_SECOND:
+        # Day/calendar (or generic) units: work at second resolution instead
+        values, unit = values.astype('datetime64[s]'), 's'
+    scale = _TICKS_PER_SECOND[unit]
+    ticks = values.astype(np.int64)
+    i = np.maximum(np.searchsorted(_scaled(np, src_table.walls, scale), ticks, side='right') - 1, 0)
+    utc = ticks - _scaled(np, src_table.offsets, scale)[i]
+    j = np.maximum(np.searchsorted(_scaled(np, dst_table.starts, scale), utc, side='right') - 1, 0)
+    out = (utc + _scaled(np, dst_table.offsets, scale)[j]).astype(f'datetime64[{unit}]')
+    nat = np.isnat(values)
+    out[nat] = np.datetime64('NaT')
+    seconds = ticks // scale
+    uncovered = ~nat & ((seconds < src_table.valid_from + DAY_SECONDS) | (seconds >= src_table.valid_until - DAY_SECONDS)
+                        | (utc // scale < dst_table.valid_from) | (utc // scale >= dst_table.valid_until))
+    for k in np.flatnonzero(uncovered):
+        shift = _fallback_shift(int(seconds[k]), src_tz, dst_tz)
+        out[k] = values[k] + np.timedelta64(shift, 's')
+    return out
+
+
+def convert_batch(timestamps, src, dst):
+    src_tz, dst_tz = resolve_zone(src), resolve_zone(dst)
+    # NumPy is optional and never imported here: if the caller hasn't loaded
+    # it, the input can't be an ndarray
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(timestamps, np.ndarray) and timestamps.dtype.kind == 'M':
+        return _convert_numpy(np, timestamps, src_tz, dst_tz)
+    if isinstance(timestamps, array):
+        if timestamps.typecode in ('f', 'd'):
+            seconds = [int(v // 1) for v in timestamps]
+        else:
+            seconds = timestamps
+        shifts = _shift_seconds(seconds, src_tz, dst_tz)
+        return array(timestamps.typecode, (v + s for v, s in zip(timestamps, shifts)))
+    timestamps = list(timestamps)
+    seconds = [(dt - EPOCH) // ONE_SECOND for dt in timestamps]
+    shifts = _shift_seconds(seconds, src_tz, dst_tz)
+    return [dt + timedelta(seconds=s) for dt, s in zip(timestamps, shifts)]
@@ -0,0 +1,125 @@
+"""Memory and startup cost of each alarm audio backend.
+
+    python benchmarks/bench_audio.py [--backends pygame,wave,null] [--plays 20] [--dummy-audio]
+
+For each backend a fresh interpreter imports audio_service, loads a generated
+0.2 s WAV through that backend only, then plays it --plays times. Printed per
+backend:
+  - the modules and resident memory the first load added
+  - how long that first load took, which includes importing and starting the
+    backend
+  - trigger-to-playback latency
+Backends that can't run here are reported as unavailable.
+--dummy-audio points SDL at its dummy driver, so pygame runs without a sound
+card.
+"""
+import argparse
+import json
+import math
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SOUND = "bench_alarm.wav"
+
+
+def rss_kb():
+    # Current resident set size where /proc has it, else the peak
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def write_wav(path, seconds=0.2, rate=44100):
+    frames = b"".join(struct.pack("<hh", int(6000 * math.sin(i * 0.06)), 0) for i in range(int(seconds * rate)))
+    with wave.open(path, "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(frames)
+
+
+def child(backend, plays, sound_dir):
+    # Runs in its own interpreter (see main()) so imports and memory are its own
+    import audio_service
+    service = audio_service.AudioService(sound_dir, backends=[backend])
+    modules, rss = len(sys.modules), rss_kb()
+    start = time.perf_counter()
+    service.prepare(SOUND)
+    service.wait()
+    load_ms = (time.perf_counter() - start) * 1000
+    if SOUND in service.failed:
+        return {"backend": backend, "error": service.failed[SOUND]}
+    result = {
+        "backend": backend,
+        "load_ms": load_ms,
+        "modules": len(sys.modules) - modules,
+        "rss_kb": rss_kb() - rss if rss is not None else None,
+    }
+    for i in range(plays):
+        service.play(SOUND)
+        # Some backends report the start from their own thread
+        deadline = time.perf_counter() + 5
+        while len(service.latencies) <= i and time.perf_counter() < deadline:
+            time.sleep(0.001)
+    stats = service.latency_stats() or {}
+    result.update(trigger_mean_ms=stats.get("mean_ms"), trigger_max_ms=stats.get("max_ms"),
+                  buffer_ms=service.latencies[-1]["buffer_ms"] if service.latencies else None)
+    return result
+
+
+def run_child(backend, plays, sound_dir, dummy_audio):
+    code = f"import json, bench_audio; print(json.dumps(bench_audio.child({backend!r}, {plays}, {sound_dir!r})))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, HERE]), PYTHONDONTWRITEBYTECODE="1")
+    if dummy_audio:
+        env["SDL_AUDIODRIVER"] = "dummy"
+    proc = subprocess.run([sys.executable, "-c", code], cwd=sound_dir, env=env, capture_output=True, text=True)
+    if proc.returncode:
+        return {"backend": backend, "error": proc.stderr.strip().splitlines()[-1]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def ms(value, width):
+    return format("n/a" if value is None else f"{value:.3f} ms", f">{width}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--backends", default="pygame,wave,null")
+    ap.add_argument("--plays", type=int, default=20)
+    ap.add_argument("--dummy-audio", action="store_true", help="use SDL's dummy audio driver")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as sound_dir:
+        write_wav(os.path.join(sound_dir, SOUND))
+        results = [run_child(name.strip(), args.plays, sound_dir, args.dummy_audio)
+                   for name in args.backends.split(",") if name.strip()]
+
+    print(f"{'backend':8} {'first load':>11} {'modules':>8} {'memory':>10} {'trigger':>10} {'max':>9} {'buffer':>10}")
+    for r in results:
+        if "error" in r:
+            print(f"{r['backend']:8} unavailable: {r['error']}")
+            continue
+        rss = f"{r['rss_kb'] / 1024:.1f} MB" if r["rss_kb"] is not None else "n/a"
+        print(f"{r['backend']:8} {r['load_ms']:8.1f} ms {r['modules']:8d} {rss:>10} "
+              f"{ms(r['trigger_mean_ms'], 10)} {ms(r['trigger_max_ms'], 9)} {ms(r['buffer_ms'], 10)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""Import-time profile (python -X importtime) for the app's entry modules.
+
+    python benchmarks/bench_imports.py [--module main] [--top 15] [--runs 5] [--check]
+
+Each run imports the module in a fresh interpreter and parses the
+-X importtime report from stderr. The script prints the median total and the
+slowest direct imports of the module. With --check it exits non-zero if a
+module that must stay lazy (pygame and the other audio backends, pytz,
+dateutil, tzlocal, plus PyQt5 for the CLI) was imported, so a regression in
+time-to-first-window shows up in CI.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be imported just by loading the given entry module
+DEFERRED = {
+    "main": ("pygame", "pytz", "dateutil", "tzlocal", "audio_backends"),
+    "cli": ("PyQt5", "pygame", "dateutil", "tzlocal"),
+    "engine": ("PyQt5", "pygame", "dateutil", "tzlocal"),
+}
+
+LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def profile_once(module):
+    # Run from a scratch directory: importing main creates Moist/ next to argv[0]
+    with tempfile.TemporaryDirectory() as cwd:
+        env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE="1")
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              cwd=cwd, env=env, capture_output=True, text=True)
+    if proc.returncode:
+        sys.exit(proc.stderr)
+    entries = []
+    for line in proc.stderr.splitlines():
+        m = LINE_RE.match(line)
+        if m:
+            self_us, cumulative_us, indent, name = m.groups()
+            entries.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--module", default="main", help="module to import (default: main)")
+    ap.add_argument("--top", type=int, default=15, help="how many direct imports to list")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--check", action="store_true", help="fail if a deferred module was imported")
+    args = ap.parse_args()
+
+    runs = [profile_once(args.module) for _ in range(args.runs)]
+    totals = [sum(cum for _, _, cum, depth in entries if depth == 0) for entries in runs]
+    print(f"import {args.module}: median {statistics.median(totals) / 1000:.1f} ms "
+          f"(min {min(totals) / 1000:.1f}, max {max(totals) / 1000:.1f}) over {args.runs} runs")
+
+    # Slowest direct imports of the module, median over runs
+    per_module = {}
+    for entries in runs:
+        for name, _, cum, depth in entries:
+            if depth == 1:
+                per_module.setdefault(name, []).append(cum)
+    ranked = sorted(per_module.items(), key=lambda kv: -statistics.median(kv[1]))
+    print(f"\n{'cumulative ms':>14}  module")
+    for name, values in ranked[:args.top]:
+        print(f"{statistics.median(values) / 1000:>14.1f}  {name}")
+
+    imported = {name.split(".")[0] for name, _, _, _ in runs[0]}
+    leaked = [name for name in DEFERRED.get(args.module, ()) if name in imported]
+    if leaked:
+        print(f"\nimported eagerly, should be deferred: {', '.join(leaked)}")
+        if args.check:
+            return 1
+    elif args.check:
+        print("\nno deferred modules imported")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Per-parse latency of the strict fast path vs. dateutil.
+
+    python benchmarks/bench_parse.py [--number N]
+"""
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dateutil import parser  # noqa: E402
+
+import timeparse  # noqa: E402
+
+NOW = datetime(2026, 10, 18, 9, 0)
+
+# (label, date_str, time_str) as typed into the main window
+CASES = [
+    ("MM/DD HH:MM", "03/09", "02:30"),
+    ("M/D H:MM", "3/9", "2:30"),
+    ("no date", "", "10:30"),
+]
+
+ISO_CASES = [
+    ("ISO-8601", "2026-10-18T10:30:00"),
+    ("ISO-8601 +offset", "2026-10-18T10:30:00+05:30"),
+    ("YYYY/MM/DD HH:MM", "2026/10/18 10:30"),
+]
+
+
+def per_call_us(func, number):
+    # Best of 5 repeats, so one noisy run doesn't skew the figure
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--number", type=int, default=20000)
+    args = ap.parse_args()
+
+    print(f"{'input':<20} {'fast (us)':>10} {'dateutil (us)':>14} {'speedup':>8}")
+    for label, date_str, time_str in CASES:
+        text = f"{NOW.year}/{date_str or f'{NOW.month:02}/{NOW.day:02}'} {time_str}"
+        assert timeparse.parse_date_time(date_str, time_str, NOW) == parser.parse(text)
+        fast = per_call_us(lambda: timeparse.parse_date_time(date_str, time_str, NOW), args.number)
+        slow = per_call_us(lambda: parser.parse(text), args.number)
+        print(f"{label:<20} {fast:>10.2f} {slow:>14.2f} {slow / fast:>7.1f}x")
+    for label, text in ISO_CASES:
+        assert timeparse.parse_datetime(text) == parser.parse(text)
+        fast = per_call_us(lambda: timeparse.parse_datetime(text), args.number)
+        slow = per_call_us(lambda: parser.parse(text), args.number)
+        print(f"{label:<20} {fast:>10.2f} {slow:>14.2f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Overlay drag benchmark for the countdown's snap cue.
+
+    python benchmarks/bench_snap.py [--moves 10000] [--legacy] [--check]
+
+Opens a CountdownDialog in overlay mode under Qt's offscreen platform and
+moves it --moves times, alternating between a spot that snaps to the screen
+edge and one that doesn't, the way a drag along the edge does. Prints the
+per-move cost for the first and last 10% of moves and the stylesheet size
+before and after. --legacy swaps in the old cue, which appended a border
+rule to the stylesheet on every snap, for comparison. With --check it exits
+non-zero if the stylesheet grew or late moves got much slower than early ones.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Late moves may be this much slower than early ones before --check fails
+MAX_SLOWDOWN = 1.5
+
+
+def legacy_snap_cue(dialog, snapped):
+    # What snap_to_corners used to do on every snap
+    if snapped:
+        dialog.setStyleSheet(dialog.styleSheet() +
+                             f"\nQDialog {{ border: 0.5px solid {dialog.theme_mgr.accent}; border-radius: 0px; }}")
+
+
+def child(moves, legacy):
+    # Runs inside a scratch directory (see main()) so Moist/ lands there
+    import main
+    from datetime import datetime, timedelta
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    settings = dict(main.DEFAULT_SETTINGS)
+    dialog = main.CountdownDialog(datetime.now().astimezone() + timedelta(hours=1), settings=settings)
+    dialog.show()
+    dialog.toggle_overlay()
+    if legacy:
+        dialog.set_snap_cue = lambda snapped: legacy_snap_cue(dialog, snapped)
+    screen = app.primaryScreen().geometry()
+    y = screen.y() + 100
+    snap_x = screen.x() + 5
+    free_x = screen.x() + 100
+    sheet_before = len(dialog.styleSheet())
+    timings = []
+    for i in range(moves):
+        start = time.perf_counter()
+        dialog.move(snap_x if i % 2 else free_x, y)
+        app.processEvents()
+        timings.append(time.perf_counter() - start)
+    main.settings_store.pending = None  # don't write the scratch settings
+    tenth = max(1, moves // 10)
+    return {
+        "moves": moves,
+        "total_s": sum(timings),
+        "first_us": sum(timings[:tenth]) / tenth * 1e6,
+        "last_us": sum(timings[-tenth:]) / tenth * 1e6,
+        "sheet_before": sheet_before,
+        "sheet_after": len(dialog.styleSheet()),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--moves", type=int, default=10000)
+    ap.add_argument("--legacy", action="store_true", help="use the old appending snap cue")
+    ap.add_argument("--check", action="store_true", help="fail on stylesheet growth or slowdown")
+    args = ap.parse_args()
+
+    code = f"import json, bench_snap; print(json.dumps(bench_snap.child({args.moves}, {args.legacy})))"
+    with tempfile.TemporaryDirectory() as cwd:
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, HERE]), QT_QPA_PLATFORM="offscreen",
+                   PYTHONDONTWRITEBYTECODE="1")
+        proc = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env,
+                              capture_output=True, text=True)
+    if proc.returncode:
+        sys.exit(proc.stderr)
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    slowdown = result["last_us"] / result["first_us"]
+    print(f"{result['moves']} moves in {result['total_s']:.2f} s "
+          f"({'legacy' if args.legacy else 'state-based'} snap cue)")
+    print(f"  per move, first 10%: {result['first_us']:8.1f} us")
+    print(f"  per move, last 10%:  {result['last_us']:8.1f} us  ({slowdown:.2f}x)")
+    print(f"  stylesheet: {result['sheet_before']} -> {result['sheet_after']} chars")
+    if args.check and (result["sheet_after"] != result["sheet_before"] or slowdown > MAX_SLOWDOWN):
+        print("snap cue cost is growing with drags")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""Launch-to-first-paint benchmark for the main window.
+
+    python benchmarks/bench_startup.py [--runs 20] [--warm] [--json]
+
+Starts the app in a fresh interpreter under Qt's offscreen platform, lets
+it write its startup_profile report at first paint and quit, and prints
+per-phase percentiles over all runs. Each run gets an empty scratch
+directory, so Moist/ (settings, offset map) starts cold unless --warm is
+given, in which case one directory is shared by all runs.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAUNCH = "import sys, main; sys.exit(main.run())"
+
+
+def run_once(cwd):
+    fd, report_path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    env = dict(os.environ, PYTHONPATH=ROOT, QT_QPA_PLATFORM="offscreen",
+               TZC_STARTUP_REPORT=report_path, TZC_STARTUP_EXIT="1")
+    try:
+        env["TZC_LAUNCH_TIME"] = repr(time.time())
+        proc = subprocess.run([sys.executable, "-c", LAUNCH], cwd=cwd, env=env,
+                              capture_output=True, text=True, timeout=60)
+        wall_ms = (time.time() - float(env["TZC_LAUNCH_TIME"])) * 1000
+        if proc.returncode:
+            sys.exit(proc.stderr)
+        with open(report_path) as f:
+            report = json.load(f)
+    finally:
+        os.remove(report_path)
+    report["phases"]["process_total"] = wall_ms
+    return report
+
+
+def percentile(values, p):
+    values = sorted(values)
+    k = (len(values) - 1) * p / 100
+    lo, hi = int(k), min(int(k) + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=20)
+    ap.add_argument("--warm", action="store_true", help="reuse one Moist/ directory across runs")
+    ap.add_argument("--json", action="store_true", help="print raw per-run reports as JSON")
+    args = ap.parse_args()
+
+    reports = []
+    with tempfile.TemporaryDirectory() as shared:
+        for _ in range(args.runs):
+            if args.warm:
+                reports.append(run_once(shared))
+            else:
+                with tempfile.TemporaryDirectory() as cwd:
+                    reports.append(run_once(cwd))
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+        return 0
+
+    names = list(reports[0]["phases"])
+    names.insert(len(names) - 1, "total_ms")
+    print(f"{args.runs} runs ({'warm' if args.warm else 'cold'} Moist/), milliseconds")
+    print(f"{'phase':<16} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    for name in names:
+        values = [r["total_ms"] if name == "total_ms" else r["phases"][name] for r in reports]
+        print(f"{name:<16} {percentile(values, 50):>8.1f} {percentile(values, 90):>8.1f} "
+              f"{percentile(values, 99):>8.1f} {max(values):>8.1f}")
+    print(f"(mean first paint at {statistics.mean(r['total_ms'] for r in reports):.1f} ms after launch)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
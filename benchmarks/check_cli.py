@@ -0,0 +1,64 @@
+"""Check that the batch converter survives unreadable JSONL lines.
+
+    python benchmarks/check_cli.py
+
+Feeds `python -m src convert -f jsonl` a stream with a line that isn't JSON
+and one that is JSON but not an object, mixed in with good rows and spread
+over more than one chunk. Both bad lines have to be reported and counted like
+a bad timestamp, every other row has to come out converted, and --strict has
+to stop at the first bad line after writing the rows before it. Exits
+non-zero on any failure.
+"""
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cli import CHUNK_SIZE
+
+GOOD = json.dumps({"timestamp": "2024-01-01 00:00"})
+BAD = ("notjson", "[1, 2]")
+
+
+def convert(lines, *args):
+    proc = subprocess.run([sys.executable, "-m", "src", "convert", "-f", "jsonl", "--to", "Japan", *args],
+                          cwd=ROOT, input="".join(line + "\n" for line in lines),
+                          capture_output=True, text=True)
+    return proc.returncode, proc.stdout.splitlines(), proc.stderr.splitlines()
+
+
+def main():
+    problems = []
+    # One bad line inside the first chunk, one after it; 1-based row numbers
+    lines = [GOOD] * (CHUNK_SIZE + 10)
+    lines[2], lines[CHUNK_SIZE + 5] = BAD
+    bad_rows = (3, CHUNK_SIZE + 6)
+
+    code, out, err = convert(lines)
+    if code != 1:
+        problems.append(f"exit code {code}, expected 1")
+    if len(out) != len(lines) - len(BAD):
+        problems.append(f"{len(out)} rows written, expected {len(lines) - len(BAD)}")
+    if any(json.loads(row).get("converted") != "2024-01-01T09:00:00" for row in out):
+        problems.append("a written row wasn't converted")
+    for row in bad_rows:
+        if not any(line.startswith(f"row {row}: ValueError") for line in err):
+            problems.append(f"row {row} wasn't reported")
+    if f"{len(BAD)} of {len(lines)} rows could not be converted" not in err:
+        problems.append(f"error summary wrong: {err[-1:]}")
+
+    code, out, err = convert(lines, "--strict")
+    if code != 1 or len(out) != bad_rows[0] - 1 or len(err) != 1 or not err[0].startswith(f"row {bad_rows[0]}:"):
+        problems.append(f"--strict: exit {code}, {len(out)} rows written, stderr {err}")
+
+    for problem in problems:
+        print(f"  {problem}")
+    print(f"{'FAILED' if problems else 'ok'}: unreadable JSONL lines")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Check the table-driven conversions against pytz itself.
+
+    python benchmarks/check_tables.py [--show 10]
+
+For every TIMEZONES row, every transition in the cached year range is probed
+on both sides: wall-clock times just before, inside and just after each DST
+gap and overlap go through convert_datetime() (to UTC and to the next row),
+and UTC instants around the transition go through convert_datetime() from
+UTC. Each result is compared field by field with pytz's localize() (is_dst
+False, as the engine promises) followed by astimezone(). A few times outside
+the cached range check the pytz fallback too. Exits non-zero on any mismatch.
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytz
+
+from engine import TIMEZONES, convert_datetime
+from transitions import get_year_range
+
+# Offsets (seconds) from each transition's wall/UTC time that get probed
+PROBES = (-3601, -1800, -1, 0, 1, 1800, 3599, 3600, 3601)
+OUTSIDE = (datetime(1850, 6, 1, 12), datetime(2050, 1, 15, 8), datetime(2050, 7, 15, 8))
+
+
+def fields(result):
+    src, dst = result.src_dt, result.dst_dt
+    return (src.replace(tzinfo=None), src.utcoffset(), src.tzname(), bool(src.dst()),
+            dst.replace(tzinfo=None), dst.utcoffset(), dst.tzname(), bool(dst.dst()))
+
+
+def expected(dt, src_tz, dst_tz):
+    src = src_tz.localize(dt, is_dst=False)
+    dst = dst_tz.normalize(src.astimezone(dst_tz)) if hasattr(dst_tz, "normalize") else src.astimezone(dst_tz)
+    return (src.replace(tzinfo=None), src.utcoffset(), src.tzname(), bool(src.dst()),
+            dst.replace(tzinfo=None), dst.utcoffset(), dst.tzname(), bool(dst.dst()))
+
+
+def transitions_in_range(tz):
+    first, last = get_year_range()
+    start, end = datetime(first, 1, 1), datetime(last + 1, 1, 1)
+    infos = getattr(tz, "_transition_info", [])
+    for i, when in enumerate(getattr(tz, "_utc_transition_times", [])[1:], 1):
+        if start <= when < end:
+            yield when, infos[i - 1][0], infos[i][0]
+
+
+def samples(tz):
+    # (naive wall time in tz, naive UTC instant) pairs around every transition
+    walls, instants = set(OUTSIDE), set(OUTSIDE)
+    for when, before, after in transitions_in_range(tz):
+        for probe in PROBES:
+            step = timedelta(seconds=probe)
+            walls.update((when + before + step, when + after + step))
+            instants.add(when + step)
+    return sorted(walls), sorted(instants)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--show", type=int, default=10, help="mismatches to print")
+    args = ap.parse_args()
+
+    utc = pytz.utc
+    checked = 0
+    mismatches = []
+    for row, entry in enumerate(TIMEZONES):
+        tz = pytz.timezone(entry[5])
+        other_row = (row + 1) % len(TIMEZONES)
+        other = pytz.timezone(TIMEZONES[other_row][5])
+        walls, instants = samples(tz)
+        cases = [(dt, row, tz, target, target_tz) for dt in walls
+                 for target, target_tz in (("UTC", utc), (other_row, other))]
+        cases += [(dt, "UTC", utc, row, tz) for dt in instants]
+        for dt, src, src_tz, dst, dst_tz in cases:
+            checked += 1
+            got = fields(convert_datetime(dt, src, dst))
+            want = expected(dt, src_tz, dst_tz)
+            if got != want:
+                mismatches.append((entry[5], dt, src, dst, got, want))
+
+    print(f"{checked} conversions over {len(TIMEZONES)} zones, years {get_year_range()[0]}-{get_year_range()[1]}: "
+          f"{len(mismatches)} mismatches")
+    for name, dt, src, dst, got, want in mismatches[:args.show]:
+        print(f"  {name}: {dt} {src!r} -> {dst!r}\n    tables: {got}\n    pytz:   {want}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
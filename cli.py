@@ -0,0 +1,216 @@
+"""Headless batch converter: python -m src convert [options] [FILE]
+
+Streams CSV or JSONL rows from FILE (or stdin), converts one timestamp
+column per row between two zones and writes each row back out as soon as
+its chunk is done, so memory stays flat no matter how big the input is.
+Only the Qt-free engine modules are imported here, never PyQt5 or pygame.
+
+Zones can be a TIMEZONES row number or region name ("Japan"), an IANA name
+("Europe/Paris") or a custom offset ("UTC+5:30"). Timestamps are read as
+wall-clock time in the source zone; ones carrying their own UTC offset
+are converted from that offset instead.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+from batch import convert_batch
+from engine import TIMEZONES, astimezone, resolve_zone
+from timeparse import parse_datetime
+
+CHUNK_SIZE = 4096
+REGIONS = {row[4].lower(): i for i, row in enumerate(TIMEZONES)}
+
+
+def lookup_zone(text):
+    text = text.strip()
+    if text.isdigit():
+        row = int(text)
+        if row >= len(TIMEZONES):
+            raise ValueError(f"no timezone row {row} (rows are 0-{len(TIMEZONES) - 1})")
+        return row
+    if text.lower() in REGIONS:
+        return REGIONS[text.lower()]
+    # Raises for unknown names so typos fail before any output is written
+    resolve_zone(text)
+    return text
+
+
+def build_parser():
+    ap = argparse.ArgumentParser(prog="python -m src convert", description=__doc__.splitlines()[0],
+                                 formatter_class=argparse.RawDescriptionHelpFormatter,
+                                 epilog="\n".join(__doc__.splitlines()[2:]))
+    ap.add_argument("input", nargs="?", default="-", help="CSV/JSONL file to read (default: stdin)")
+    ap.add_argument("-o", "--output", default="-", help="file to write (default: stdout)")
+    ap.add_argument("--from", dest="src", default="UTC", help="source zone (default: UTC)")
+    ap.add_argument("--to", dest="dst", default="UTC", help="destination zone (default: UTC)")
+    ap.add_argument("--from-column", help="take the source zone from this column when it's set")
+    ap.add_argument("--to-column", help="take the destination zone from this column when it's set")
+    ap.add_argument("-c", "--column", default="timestamp",
+                    help="timestamp column/field (default: timestamp, or the first CSV column)")
+    ap.add_argument("--out-column", default="converted", help="column for the result (default: converted)")
+    ap.add_argument("--in-place", action="store_true", help="overwrite the timestamp column instead")
+    ap.add_argument("-f", "--format", choices=("csv", "jsonl"), help="input/output format (default: from extension, else csv)")
+    ap.add_argument("--strftime", help="output format (default: ISO-8601)")
+    ap.add_argument("--strict", action="store_true", help="stop at the first row that can't be converted")
+    return ap
+
+
+def read_rows(stream, fmt):
+    # A JSONL line that isn't a JSON object yields the ValueError saying why,
+    # so it fails like a bad timestamp instead of ending the stream
+    if fmt == "jsonl":
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield ValueError(f"invalid JSON: {e}")
+                continue
+            yield row if isinstance(row, dict) else ValueError(f"expected a JSON object, got {type(row).__name__}")
+    else:
+        yield from csv.DictReader(stream)
+
+
+class RowWriter:
+    def __init__(self, stream, fmt):
+        self.stream = stream
+        self.fmt = fmt
+        self.csv_writer = None
+
+    def write(self, row):
+        if self.fmt == "jsonl":
+            self.stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+            return
+        if self.csv_writer is None:
+            # Header comes from the first row so the output column lands last
+            self.csv_writer = csv.DictWriter(self.stream, fieldnames=list(row), extrasaction="ignore")
+            self.csv_writer.writeheader()
+        self.csv_writer.writerow(row)
+
+
+class Converter:
+    def __init__(self, args):
+        self.args = args
+        self.src = lookup_zone(args.src)
+        self.dst = lookup_zone(args.dst)
+        self.zone_cache = {}
+        self.column = args.column
+        self.out_column = args.column if args.in_place else args.out_column
+        self.rows = 0
+        self.errors = 0
+
+    def zone_for(self, row, column, default):
+        value = row.get(column) if column else None
+        if not value:
+            return default
+        zone = self.zone_cache.get(value)
+        if zone is None:
+            zone = self.zone_cache[value] = lookup_zone(value)
+        return zone
+
+    def fail(self, row_number, message):
+        self.errors += 1
+        if self.args.strict:
+            raise SystemExit(f"row {row_number}: {message}")
+        print(f"row {row_number}: {message}", file=sys.stderr)
+
+    def format(self, dt):
+        return dt.strftime(self.args.strftime) if self.args.strftime else dt.isoformat()
+
+    def convert_chunk(self, rows, numbers):
+        # Group naive timestamps by zone pair so each group is one batch call
+        groups = {}
+        results = [None] * len(rows)
+        for i, row in enumerate(rows):
+            try:
+                src = self.zone_for(row, self.args.from_column, self.src)
+                dst = self.zone_for(row, self.args.to_column, self.dst)
+                dt = parse_datetime(str(row[self.column]))
+                if dt.tzinfo is not None:
+                    results[i] = astimezone(dt, resolve_zone(dst)).replace(tzinfo=None)
+                else:
+                    groups.setdefault((src, dst), []).append((i, dt))
+            except Exception as e:
+                self.fail(numbers[i], f"{type(e).__name__}: {e}")
+        for (src, dst), items in groups.items():
+            try:
+                converted = convert_batch([dt for _, dt in items], src, dst)
+            except Exception as e:
+                # Only this zone pair's rows fail; the rest of the chunk still converts
+                for i, _ in items:
+                    self.fail(numbers[i], f"{type(e).__name__}: {e}")
+                continue
+            for (i, _), dt in zip(items, converted):
+                results[i] = dt
+        for row, dt in zip(rows, results):
+            row[self.out_column] = self.format(dt) if dt is not None else ""
+        return rows
+
+    def run(self, rows, writer):
+        # Row numbers ride along with the chunk, as unreadable rows leave gaps
+        chunk, numbers = [], []
+        for row in rows:
+            if isinstance(row, Exception):
+                self.rows += 1
+                if self.args.strict:
+                    # Everything before the bad row still goes out
+                    self.flush(chunk, numbers, writer)
+                    chunk, numbers = [], []
+                self.fail(self.rows, f"{type(row).__name__}: {row}")
+                continue
+            if self.rows == 0 and self.column not in row and self.args.format != "jsonl" and row:
+                self.column = next(iter(row))
+                if self.args.in_place:
+                    self.out_column = self.column
+            chunk.append(row)
+            self.rows += 1
+            numbers.append(self.rows)
+            if len(chunk) >= CHUNK_SIZE:
+                self.flush(chunk, numbers, writer)
+                chunk, numbers = [], []
+        if chunk:
+            self.flush(chunk, numbers, writer)
+
+    def flush(self, chunk, numbers, writer):
+        for row in self.convert_chunk(chunk, numbers):
+            writer.write(row)
+
+
+def detect_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    return "jsonl" if ext in (".jsonl", ".ndjson", ".json") else "csv"
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.format = args.format or detect_format(args.input)
+    try:
+        converter = Converter(args)
+    except Exception as e:
+        print(f"Unknown timezone: {e}", file=sys.stderr)
+        return 2
+    src = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        converter.run(read_rows(src, args.format), RowWriter(dst, args.format))
+    except BrokenPipeError:
+        # e.g. piped into head; nothing left to write to
+        sys.stderr.close()
+        return 0
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    if converter.errors:
+        print(f"{converter.errors} of {converter.rows} rows could not be converted", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""When a countdown display next needs to wake up.
+
+A countdown shows whole seconds left, so its text only changes when the time
+remaining crosses an integer. Rather than ticking every 1000 ms from whenever
+the timer happened to start (which drifts against those crossings and makes
+the display skip or repeat a second), each wakeup is scheduled for just after
+the next crossing. The remaining time is re-read from the wall clock on every
+wakeup, so late timers after a suspend/resume and system clock changes are
+corrected on the next tick instead of accumulating.
+
+Any number of countdowns share one timer: TickSchedule keeps their next
+wakeups in a min-heap, so the timer only ever waits for the earliest one.
+
+Nothing here imports Qt; main.py's CountdownManager owns the actual timer.
+"""
+import heapq
+import itertools
+import time
+
+# Fire a little after the boundary so the floored seconds have moved on
+TICK_SLACK = 0.005
+# Resolution while the countdown can't be seen (hidden or minimized)
+HIDDEN_RESOLUTION = 60.0
+
+
+def remaining_seconds(target_dt, now=None):
+    return target_dt.timestamp() - (time.time() if now is None else now)
+
+
+def next_delay(remaining, resolution=1.0):
+    # Seconds until the remaining time next crosses a multiple of resolution,
+    # or None once the target has been reached. With a coarse resolution the
+    # last wakeup still lands on the target, since 0 is a multiple of anything.
+    if remaining <= 0:
+        return None
+    step = remaining % resolution
+    return (step if step > 0 else resolution) + TICK_SLACK
+
+
+class TickSchedule:
+    """Min-heap of next wakeup times (time.monotonic()) keyed by countdown.
+
+    Rescheduling or cancelling a key doesn't search the heap; the old entry
+    is just left behind and skipped when it surfaces, so every operation is
+    O(log n) in the number of countdowns.
+    """
+    def __init__(self):
+        self.heap = []
+        self.current = {}
+        self.counter = itertools.count()
+
+    def __len__(self):
+        return len(self.current)
+
+    def __contains__(self, key):
+        return key in self.current
+
+    def schedule(self, key, wake_at):
+        seq = next(self.counter)
+        self.current[key] = seq
+        heapq.heappush(self.heap, (wake_at, seq, key))
+        if len(self.heap) > 2 * len(self.current) + 16:
+            # Shed left-behind entries so restarts can't grow the heap forever
+            self.heap = [entry for entry in self.heap if self.current.get(entry[2]) == entry[1]]
+            heapq.heapify(self.heap)
+
+    def cancel(self, key):
+        self.current.pop(key, None)
+
+    def _drop_stale(self):
+        while self.heap and self.current.get(self.heap[0][2]) != self.heap[0][1]:
+            heapq.heappop(self.heap)
+
+    def next_wake(self):
+        self._drop_stale()
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, now):
+        due = []
+        self._drop_stale()
+        while self.heap and self.heap[0][0] <= now:
+            _, _, key = heapq.heappop(self.heap)
+            del self.current[key]
+            due.append(key)
+            self._drop_stale()
+        return due
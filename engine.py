@@ -0,0 +1,225 @@
+"""Qt-free timezone conversion engine shared by the GUI and scripts."""
+import re
+from collections import OrderedDict, namedtuple
+from datetime import timedelta, tzinfo
+
+from timeparse import parse_date_time
+import transitions
+from transitions import get_table, preload, to_seconds
+
+TIMEZONES = [
+    ("PST", "PDT", "UTC-8", "UTC-7", "America Pacific", "US/Pacific"),
+    ("MST", "MDT", "UTC-7", "UTC-6", "America Mountain", "US/Mountain"),
+    ("CST", "CDT", "UTC-6", "UTC-5", "America Central", "US/Central"),
+    ("EST", "EDT", "UTC-5", "UTC-4", "America Eastern", "US/Eastern"),
+    ("AST", "ADT", "UTC-4", "UTC-3", "America Atlantic", "Canada/Atlantic"),
+    ("GMT", "BST", "UTC+0", "UTC+1", "UK", "Europe/London"),
+    ("CET", "CEST", "UTC+1", "UTC+2", "Europe Central", "Europe/Paris"),
+    ("EET", "EEST", "UTC+2", "UTC+3", "Europe Eastern", "Europe/Athens"),
+    ("SAST", "SAST", "UTC+2", "UTC+2", "South Africa", "Africa/Johannesburg"),
+    ("MSK", "MSD", "UTC+3", "UTC+4", "Moscow", "Europe/Moscow"),
+    ("IST", "IDT", "UTC+2", "UTC+3", "Israel", "Asia/Jerusalem"),
+    ("UTC", "UTC", "UTC+0", "UTC+0", "Universal", "UTC"),
+    ("JST", "JST", "UTC+9", "UTC+9", "Japan", "Asia/Tokyo"),
+    ("CST", "CST", "UTC+8", "UTC+8", "China", "Asia/Shanghai"),
+    ("IST", "IST", "UTC+5:30", "UTC+5:30", "India", "Asia/Kolkata"),
+    ("AEST", "AEDT", "UTC+10", "UTC+11", "Australia East", "Australia/Sydney"),
+    ("NZST", "NZDT", "UTC+12", "UTC+13", "New Zealand", "Pacific/Auckland"),
+    ("BRT", "BRST", "UTC-3", "UTC-2", "Brazil", "America/Sao_Paulo"),
+    ("GST", "GST", "UTC+4", "UTC+4", "Dubai", "Asia/Dubai"),
+    ("SGT", "SGT", "UTC+8", "UTC+8", "Singapore", "Asia/Singapore"),
+]
+
+CUSTOM_OFFSET_RE = re.compile(r"^UTC\s*([+-])\s*(\d{1,2})(?::?(\d{2}))?$", re.IGNORECASE)
+
+ConversionResult = namedtuple("ConversionResult", [
+    "src_dt",        # aware datetime in the source zone
+    "dst_dt",        # aware datetime in the destination zone
+    "offset_delta",  # destination UTC offset minus source UTC offset
+    "src_is_dst",
+    "dst_is_dst",
+    "src_abbr",
+    "dst_abbr",
+])
+
+
+_timezone_tzs = None
+
+
+class FixedOffset(tzinfo):
+    """Custom UTC offset given in (possibly fractional) hours."""
+    def __init__(self, offset):
+        self.__offset = timedelta(hours=offset)
+        self.hours = offset
+
+    def utcoffset(self, dt):
+        return self.__offset
+
+    def tzname(self, dt):
+        total = int(self.__offset.total_seconds())
+        sign = '+' if total >= 0 else '-'
+        h, rem = divmod(abs(total), 3600)
+        return f"UTC{sign}{h}" + (f":{rem // 60:02}" if rem else "")
+
+    def dst(self, dt):
+        return timedelta(0)
+
+    def __repr__(self):
+        return f"FixedOffset({self.hours!r})"
+
+
+def parse_offset(text):
+    # "UTC+5", "UTC-03:30", "utc+0530" -> hours, or None if not an offset
+    m = CUSTOM_OFFSET_RE.match(text.strip())
+    if not m:
+        return None
+    sign, hours, minutes = m.groups()
+    value = int(hours) + (int(minutes) / 60 if minutes else 0)
+    return -value if sign == '-' else value
+
+
+def resolve_zone(zone):
+    # Accepts a TIMEZONES row index, an IANA name, "UTC+H[:MM]" or a tzinfo
+    if isinstance(zone, tzinfo):
+        return zone
+    if isinstance(zone, int):
+        if zone < 0:
+            raise IndexError("timezone index out of range")
+        return timezone_tzinfos()[zone]
+    offset = parse_offset(zone)
+    if offset is not None:
+        return FixedOffset(offset)
+    # pytz is only loaded once a named zone is actually needed
+    import pytz
+    return pytz.timezone(zone)
+
+
+def timezone_tzinfos():
+    # pytz zones for every TIMEZONES row; their transition tables are built in
+    # one pass the first time any row is used
+    global _timezone_tzs
+    if _timezone_tzs is None:
+        import pytz
+        _timezone_tzs = [pytz.timezone(row[5]) for row in TIMEZONES]
+        preload(_timezone_tzs)
+    return _timezone_tzs
+
+
+def localize(dt, tz):
+    # Same result as pytz's tz.localize(dt), via one bisect on the cached table
+    table = get_table(tz)
+    seconds = to_seconds(dt)
+    if table.covers_wall(seconds):
+        return dt.replace(tzinfo=table.tzinfos[table.index_for_wall(seconds)])
+    if hasattr(tz, "localize"):
+        return tz.localize(dt)
+    return dt.replace(tzinfo=tz)
+
+
+def astimezone(aware, tz):
+    # Same result as aware.astimezone(tz) for pytz and fixed-offset zones
+    table = get_table(tz)
+    utc = aware.replace(tzinfo=None) - aware.utcoffset()
+    seconds = to_seconds(utc)
+    if table.covers_utc(seconds):
+        i = table.index_for_utc(seconds)
+        return (utc + timedelta(seconds=table.offsets[i])).replace(tzinfo=table.tzinfos[i])
+    return aware.astimezone(tz)
+
+
+def parse_input(date_str, time_str, now=None):
+    return parse_date_time(date_str, time_str, now)
+
+
+def convert_datetime(dt, src, dst):
+    src_dt = localize(dt, resolve_zone(src))
+    dst_dt = astimezone(src_dt, resolve_zone(dst))
+    return ConversionResult(
+        src_dt=src_dt,
+        dst_dt=dst_dt,
+        offset_delta=dst_dt.utcoffset() - src_dt.utcoffset(),
+        src_is_dst=bool(src_dt.dst()),
+        dst_is_dst=bool(dst_dt.dst()),
+        src_abbr=src_dt.tzname(),
+        dst_abbr=dst_dt.tzname(),
+    )
+
+
+def convert(src, dst, date_str, time_str, now=None):
+    return convert_datetime(parse_input(date_str, time_str, now), src, dst)
+
+
+def zone_key(zone):
+    # Hashable, normalized form of anything resolve_zone() accepts
+    if isinstance(zone, FixedOffset):
+        return ("utc", zone.hours)
+    if isinstance(zone, tzinfo):
+        return ("tz", getattr(zone, "zone", None) or repr(zone))
+    if isinstance(zone, int):
+        return ("row", zone)
+    offset = parse_offset(zone)
+    if offset is not None:
+        return ("utc", offset)
+    return ("tz", zone)
+
+
+class ConversionCache:
+    """Size-bounded LRU of conversion results keyed by normalized inputs.
+
+    Keys carry the full naive datetime (year included), so entries on either
+    side of a DST change or a new year never collide. Rebuilding the
+    transition tables (e.g. a new year range) empties the cache.
+    """
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._generation = transitions.generation()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(src, dst, dt):
+        return zone_key(src), zone_key(dst), dt
+
+    def get(self, key):
+        if self._generation != transitions.generation():
+            self.clear()
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self._generation = transitions.generation()
+
+    def convert(self, dt, src, dst):
+        key = self.key(src, dst, dt)
+        result = self.get(key)
+        if result is None:
+            result = convert_datetime(dt, src, dst)
+            self.put(key, result)
+        return result
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
@@ -1,18 +1,26 @@
 import sys
+from startup_profile import startup
 import warnings
 warnings.filterwarnings("ignore", message=r"sipPyTypeDict\(\) is deprecated, the extension module should use sipPyTypeDictRef\(\) instead", category=DeprecationWarning)
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QLineEdit, QPushButton, QFrame, QMessageBox, QDialog, QGridLayout, QListView, QSystemTrayIcon, QMenu, QAction, QSlider
-from PyQt5.QtGui import QFont, QIcon, QPixmap, QDesktopServices, QFontMetrics, QIntValidator
-from PyQt5.QtCore import Qt, QTimer, QUrl
-import pytz
-from dateutil import parser
-import platform
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QLineEdit, QPushButton, QFrame, QDialog, QGridLayout, QListView, QSystemTrayIcon, QMenu, QAction, QSlider, QStyle, QStyleOption, QFileDialog
+from PyQt5.QtGui import QFont, QIcon, QPixmap, QFontMetrics, QFontMetricsF, QIntValidator, QPainter
+from PyQt5.QtCore import Qt, QAbstractListModel, QEvent, QIdentityProxyModel, QModelIndex, QObject, QPointF, QRectF, QSize, QTimer, pyqtSignal
+from PyQt5 import sip
 import os
 import json
-import tzlocal
-import pygame
-from datetime import datetime, timezone, timedelta
-import locale
+import math
+import time
+import weakref
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+from countdown_clock import HIDDEN_RESOLUTION, TickSchedule, next_delay, remaining_seconds
+from engine import TIMEZONES, ConversionCache, FixedOffset, convert_datetime, parse_input, resolve_zone, localize, timezone_tzinfos
+from zone_detect import detect_local_row
+from theme_detect import SystemThemeWatcher
+from audio_service import DEFAULT_SOUND, AudioService
+from zone_catalog import get_catalog
+from world_clock import FIELDS as WORLD_CLOCK_FIELDS, WorldClock, next_delay as world_clock_delay
+startup.mark("imports")
 
 import sys
 if hasattr(sys, "_MEIPASS"):
@@ -27,11 +35,14 @@ os.makedirs(MOIST_DIR, exist_ok=True)
 APP_ICON_PATH = os.path.join(base_path, "poopicon.ico")
 SETTINGS_PATH = os.path.join(MOIST_DIR, "countdown_settings.json")
 OFFSET_DB_PATH = os.path.join(MOIST_DIR, "timezone_offset_map.json")
+LOCAL_ZONE_CACHE_PATH = os.path.join(MOIST_DIR, "local_zone_cache.json")
+ZONE_CATALOG_CACHE_PATH = os.path.join(MOIST_DIR, "zone_catalog_cache.json")
 
 DEFAULT_SETTINGS = {
     "transparency": 0.5,
     "click_through": False,
     "play_sound": False,
+    "sound_file": DEFAULT_SOUND,  # name under Moist/ (extension optional), or an absolute path
     "double_click_overlay": False,
     "countdown_normal_size": [600, 180],
     "countdown_normal_pos": [100, 100],
@@ -42,28 +53,14 @@ DEFAULT_SETTINGS = {
     "main_window_size": [700, 370],
 }
 
-TIMEZONES = [
-    ("PST", "PDT", "UTC-8", "UTC-7", "America Pacific", "US/Pacific"),
-    ("MST", "MDT", "UTC-7", "UTC-6", "America Mountain", "US/Mountain"),
-    ("CST", "CDT", "UTC-6", "UTC-5", "America Central", "US/Central"),
-    ("EST", "EDT", "UTC-5", "UTC-4", "America Eastern", "US/Eastern"),
-    ("AST", "ADT", "UTC-4", "UTC-3", "America Atlantic", "Canada/Atlantic"),
-    ("GMT", "BST", "UTC+0", "UTC+1", "UK", "Europe/London"),
-    ("CET", "CEST", "UTC+1", "UTC+2", "Europe Central", "Europe/Paris"),
-    ("EET", "EEST", "UTC+2", "UTC+3", "Europe Eastern", "Europe/Athens"),
-    ("SAST", "SAST", "UTC+2", "UTC+2", "South Africa", "Africa/Johannesburg"),
-    ("MSK", "MSD", "UTC+3", "UTC+4", "Moscow", "Europe/Moscow"),
-    ("IST", "IDT", "UTC+2", "UTC+3", "Israel", "Asia/Jerusalem"),
-    ("UTC", "UTC", "UTC+0", "UTC+0", "Universal", "UTC"),
-    ("JST", "JST", "UTC+9", "UTC+9", "Japan", "Asia/Tokyo"),
-    ("CST", "CST", "UTC+8", "UTC+8", "China", "Asia/Shanghai"),
-    ("IST", "IST", "UTC+5:30", "UTC+5:30", "India", "Asia/Kolkata"),
-    ("AEST", "AEDT", "UTC+10", "UTC+11", "Australia East", "Australia/Sydney"),
-    ("NZST", "NZDT", "UTC+12", "UTC+13", "New Zealand", "Pacific/Auckland"),
-    ("BRT", "BRST", "UTC-3", "UTC-2", "Brazil", "America/Sao_Paulo"),
-    ("GST", "GST", "UTC+4", "UTC+4", "Dubai", "Asia/Dubai"),
-    ("SGT", "SGT", "UTC+8", "UTC+8", "Singapore", "Asia/Singapore"),
-]
+# Input signals arriving within this window are folded into one recompute
+RECOMPUTE_DELAY_MS = 25
+# Number of rendered conversion results kept for quick flip-backs
+RESULT_CACHE_SIZE = 128
+# Settings are written once changes have been quiet for this long
+SETTINGS_FLUSH_DELAY_MS = 500
+# Rasterized countdown glyph sets kept around (one per font size/colour/pixel ratio)
+GLYPH_ATLAS_CACHE_SIZE = 8
 
 def load_settings():
     if os.path.exists(SETTINGS_PATH):
@@ -74,89 +71,725 @@ def load_settings():
             pass
     return DEFAULT_SETTINGS.copy()
 
+class SettingsStore:
+    """Write-behind persistence for the settings dict.
+
+    save() only remembers the latest settings and (re)starts a single-shot
+    timer, so a window drag that fires hundreds of move events ends in one
+    write. flush() writes right away and is called from closeEvent. Writes go
+    to a temp file that is renamed over the real one, so a crash mid-write
+    never leaves a truncated settings file, and unchanged contents are skipped.
+    """
+    def __init__(self, path, delay_ms=SETTINGS_FLUSH_DELAY_MS):
+        self.path = path
+        self.delay_ms = delay_ms
+        self.pending = None
+        self.last_written = None
+        self.writes = 0
+        self.timer = None
+
+    def save(self, settings):
+        self.pending = settings
+        if QApplication.instance() is None:
+            # No event loop to defer to
+            self.flush()
+            return
+        if self.timer is None:
+            self.timer = QTimer()
+            self.timer.setSingleShot(True)
+            self.timer.timeout.connect(self.flush)
+        self.timer.start(self.delay_ms)
+
+    def flush(self):
+        if self.timer is not None:
+            self.timer.stop()
+        if self.pending is None:
+            return
+        settings, self.pending = self.pending, None
+        text = json.dumps(settings)
+        if text == self.last_written:
+            return
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # Keep it dirty so the next save or flush tries again
+            if self.pending is None:
+                self.pending = settings
+            return
+        self.last_written = text
+        self.writes += 1
+
+settings_store = SettingsStore(SETTINGS_PATH)
+
+# Alarm sounds are looked up in (and preloaded from) Moist/
+audio = AudioService(MOIST_DIR)
+
+def sound_name(settings):
+    return (settings or {}).get("sound_file") or DEFAULT_SOUND
+
 def save_settings(settings):
-    with open(SETTINGS_PATH, 'w') as f:
-        json.dump(settings, f)
+    settings_store.save(settings)
+
+# System light/dark preference: probed once, then kept current in the background
+theme_watcher = SystemThemeWatcher()
 
 def get_theme(settings=None):
     if settings and settings.get("theme") in ("light", "dark"):
         return settings["theme"]
-    # Try to detect dark mode on Windows
-    if platform.system() == "Windows":
-        try:
-            import winreg
-            registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
-            key = winreg.OpenKey(registry, r'SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Themes\\Personalize')
-            value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-            return "light" if value == 1 else "dark"
-        except Exception:
-            pass
-    return "light"
+    return theme_watcher.current()
+
+class SystemThemeRelay(QObject):
+    # Carries watcher callbacks (from its thread) over to the GUI thread
+    changed = pyqtSignal(str)
+
+THEME_PALETTES = {
+    "dark": {
+        "bg": "#23272E",
+        "fg": "#fff",
+        "box": "#23272E",
+        "accent": "#fff",
+        "button_bg": "#23272E",
+        "button_fg": "#fff",
+        "button_border": "#fff",
+        "toggle_on_bg": "#fff",
+        "toggle_on_fg": "#23272E",
+        "symbol": "#fff",
+        "edit_fg": "#fff",  # Bright white for QLineEdit text
+        "negative": "#FFA500",  # orange
+    },
+    "light": {
+        "bg": "#f4f8fc",
+        "fg": "#222",
+        "box": "#fff",
+        "accent": "#4682B4",
+        "button_bg": "#4682B4",
+        "button_fg": "#fff",
+        "button_border": "#4682B4",
+        "toggle_on_bg": "#fff",
+        "toggle_on_fg": "#222",
+        "symbol": "#222",
+        "edit_fg": "#222",
+        "negative": "#d32f2f",  # red
+    },
+}
+
+# Every stylesheet variant a theme needs, built once per theme and shared by
+# reference between all ThemeManagers
+StyleBundle = namedtuple("StyleBundle", "widget button toggle_on symbol_button borderless time_entry")
+_style_bundles = {}
+
+def style_bundle(theme):
+    theme = theme if theme == "dark" else "light"
+    bundle = _style_bundles.get(theme)
+    if bundle is None:
+        bundle = _style_bundles[theme] = _build_style_bundle(theme, THEME_PALETTES[theme])
+    return bundle
+
+def _build_style_bundle(theme, p):
+    base = f"border-radius: 12px; border: 2px solid {p['button_border']};"
+    if theme == "light":
+        # Invert ON-state for light mode
+        toggle_on = f"QPushButton {{ background: {p['button_fg']}; color: {p['button_bg']}; {base} }}"
+        time_entry = f"color: {p['edit_fg']}; font-weight: bold; background: {p['box']};"
+    else:
+        toggle_on = f"QPushButton {{ background: {p['toggle_on_bg']}; color: {p['toggle_on_fg']}; {base} }}"
+        # Declarations go in a QLineEdit block; Qt can't parse them bare next to a rule
+        time_entry = ("""QLineEdit {
+                color: #fff;
+                font-weight: bold;
+                background: #222;
+                selection-background-color: #444;
+                selection-color: #fff;
+            }"""
+            "QLineEdit:placeholder { color: #eee; font-weight: bold; }")
+    return StyleBundle(
+        widget=f"""
+        QWidget {{ background: {p['bg']}; color: {p['fg']}; }}
+        QFrame#resultBox {{ background: transparent; border: none; padding: 0px; margin: 0px; }}
+        QLabel#resultText {{ font-weight: bold; font-size: 20px; border-radius: 16px; background: transparent; }}
+        QComboBox, QLineEdit {{ background: {p['box']}; border-radius: 12px; border: 2px solid {p['accent']}; padding: 5px 7px; font-size: 17px; color: {p['edit_fg']}; }}
+        QComboBox::drop-down {{ border-radius: 12px; }}
+        QComboBox QListView {{ background: {p['box']}; color: {p['fg']}; font-size: 16px; }}
+        QPushButton.options-dialog-btn {{ border-radius: 12px; }}
+        """,
+        button=f"QPushButton {{ background: {p['button_bg']}; color: {p['button_fg']}; {base} }} QPushButton:pressed {{ background: {p['button_fg']}; color: {p['button_bg']}; }}",
+        toggle_on=toggle_on,
+        symbol_button=f"QPushButton {{ background: transparent; color: {p['symbol']}; font-size: 22px; {base} min-width:32px; min-height:32px; border: none; }} QPushButton:pressed {{ background: transparent; color: {p['symbol']}; }}",
+        borderless="QPushButton { background: transparent; border: none; outline: none; color: %s; font-size: 28px; min-width:32px; min-height:32px; border: none; } QPushButton:pressed { background: transparent; border: none; outline: none; }" % p['symbol'],
+        time_entry=time_entry,
+    )
 
 class ThemeManager:
     def __init__(self, theme):
         self.theme = theme
         self.apply_theme()
 
-    def set_theme(self, theme):
+    def set_theme(self, theme, save=True):
         self.theme = theme
         self.apply_theme()
         # Save theme to settings
-        if hasattr(self, 'settings'):
+        if save and getattr(self, 'settings', None) is not None:
             self.settings['theme'] = theme
             save_settings(self.settings)
 
     def apply_theme(self):
-        if self.theme == "dark":
-            self.bg = "#23272E"
-            self.fg = "#fff"
-            self.box = "#23272E"
-            self.accent = "#fff"
-            self.button_bg = "#23272E"
-            self.button_fg = "#fff"
-            self.button_border = "#fff"
-            self.toggle_on_bg = "#fff"
-            self.toggle_on_fg = "#23272E"
-            self.symbol = "#fff"
-            self.edit_fg = "#fff"  # Bright white for QLineEdit text
-            self.negative = "#FFA500"  # orange
-        else:
-            self.bg = "#f4f8fc"
-            self.fg = "#222"
-            self.box = "#fff"
-            self.accent = "#4682B4"
-            self.button_bg = "#4682B4"
-            self.button_fg = "#fff"
-            self.button_border = "#4682B4"
-            self.toggle_on_bg = "#fff"
-            self.toggle_on_fg = "#222"
-            self.symbol = "#222"
-            self.edit_fg = "#222"
-            self.negative = "#d32f2f"  # red
+        # Palette colours stay plain attributes (theme_mgr.accent etc.); every
+        # stylesheet comes from the theme's prebuilt bundle
+        for name, value in THEME_PALETTES[self.theme if self.theme == "dark" else "light"].items():
+            setattr(self, name, value)
+        self.styles = style_bundle(self.theme)
 
     def widget_stylesheet(self):
-        return f"""
-        QWidget {{ background: {self.bg}; color: {self.fg}; }}
-        QFrame#resultBox {{ background: transparent; border: none; padding: 0px; margin: 0px; }}
-        QLabel#resultText {{ font-weight: bold; font-size: 20px; border-radius: 16px; background: transparent; }}
-        QComboBox, QLineEdit {{ background: {self.box}; border-radius: 12px; border: 2px solid {self.accent}; padding: 5px 7px; font-size: 17px; color: {self.edit_fg}; }}
-        QComboBox::drop-down {{ border-radius: 12px; }}
-        QComboBox QListView {{ background: {self.box}; color: {self.fg}; font-size: 16px; }}
-        QPushButton.options-dialog-btn {{ border-radius: 12px; }}
-        """
+        return self.styles.widget
 
     def button_stylesheet(self, toggle=False, checked=False, symbol=False):
-        base = f"border-radius: 12px; border: 2px solid {self.button_border};"
         if symbol:
-            return f"QPushButton {{ background: transparent; color: {self.symbol}; font-size: 22px; {base} min-width:32px; min-height:32px; border: none; }} QPushButton:pressed {{ background: transparent; color: {self.symbol}; }}"
+            return self.styles.symbol_button
         if toggle and checked:
-            # Invert ON-state for light mode
-            if self.theme == "light":
-                return f"QPushButton {{ background: {self.button_fg}; color: {self.button_bg}; {base} }}"
+            return self.styles.toggle_on
+        return self.styles.button
+
+class ThemeRegistry:
+    """Everything a theme switch has to restyle, with the style each one uses.
+
+    Windows register themselves (their theme_mgr is switched and their widget
+    sheet re-set, which also covers their combo boxes and line edits) and their
+    buttons and time entry by role. A window that styles itself beyond the
+    plain widget sheet provides themed_stylesheet(styles) to rebuild its own.
+    Entries drop out when Qt destroys the widget. apply() restyles only the
+    registered widgets, with updates disabled on every window until all of them
+    are done, and skips widgets already showing the right sheet.
+    """
+    ROLES = {
+        "window": lambda styles, widget: widget.themed_stylesheet(styles) if hasattr(widget, "themed_stylesheet") else styles.widget,
+        "button": lambda styles, widget: styles.button,
+        "symbol": lambda styles, widget: styles.symbol_button,
+        "borderless": lambda styles, widget: styles.borderless,
+        "toggle": lambda styles, widget: styles.toggle_on if widget.isChecked() else styles.button,
+        "time_entry": lambda styles, widget: styles.time_entry,
+    }
+
+    def __init__(self):
+        self.entries = {}
+        self.counter = 0
+
+    def add(self, widget, role):
+        self.counter += 1
+        key = self.counter
+        if role == "window":
+            # Weak, so a closed parentless dialog can still be collected
+            self.entries[key] = (weakref.ref(widget), role)
+        else:
+            self.entries[key] = (lambda widget=widget: widget, role)
+        widget.destroyed.connect(lambda *args, key=key: self.entries.pop(key, None))
+        return widget
+
+    def widgets(self):
+        for ref, role in list(self.entries.values()):
+            widget = ref()
+            if widget is not None and not sip.isdeleted(widget):
+                yield widget, role
+
+    def apply(self, theme, save=True):
+        entries = list(self.widgets())
+        windows = [widget for widget, role in entries if role == "window"]
+        for window in windows:
+            window.setUpdatesEnabled(False)
+        try:
+            for window in windows:
+                window.theme_mgr.set_theme(theme, save=save)
+            for widget, role in entries:
+                owner = widget if role == "window" else widget.window()
+                styles = owner.theme_mgr.styles if hasattr(owner, "theme_mgr") else style_bundle(theme)
+                sheet = self.ROLES[role](styles, widget)
+                if widget.styleSheet() != sheet:
+                    widget.setStyleSheet(sheet)
+        finally:
+            for window in windows:
+                window.setUpdatesEnabled(True)
+
+themed = ThemeRegistry()
+
+class RecomputeScheduler:
+    """Coalesces bursts of input signals into a single recompute.
+
+    Every signal just (re)starts a short single-shot timer. When it fires, the
+    callbacks run once, and only if the normalized inputs from key_func differ
+    from the last run. Autoformat setText() calls and a combo change landing in
+    the same tick therefore cost one conversion instead of several.
+    """
+    def __init__(self, parent, key_func, callbacks, delay_ms=RECOMPUTE_DELAY_MS):
+        self.key_func = key_func
+        self.callbacks = callbacks
+        self.last_key = None
+        self.timer = QTimer(parent)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.run)
+
+    def schedule(self, *args):
+        self.timer.start()
+
+    def run(self):
+        key = self.key_func()
+        if key == self.last_key:
+            return
+        self.last_key = key
+        for callback in self.callbacks:
+            callback()
+
+class CountdownManager:
+    """The one timer behind every open countdown.
+
+    Tickers register their next wakeup in a TickSchedule heap and the shared
+    timer is armed for whichever is earliest, so twenty countdowns still mean
+    one QTimer and each wakeup costs O(log n).
+    """
+    # Wakeups this close together are handled in the same pass
+    COALESCE = 0.002
+
+    def __init__(self):
+        self.schedule = TickSchedule()
+        self.timer = None
+        self.firing = False
+        self.wakeups = 0
+
+    def add(self, ticker, delay):
+        self.schedule.schedule(ticker, time.monotonic() + delay)
+        self._arm()
+
+    def remove(self, ticker):
+        self.schedule.cancel(ticker)
+        self._arm()
+
+    def _arm(self):
+        if self.firing:
+            return
+        if self.timer is None:
+            self.timer = QTimer()
+            self.timer.setSingleShot(True)
+            self.timer.setTimerType(Qt.PreciseTimer)
+            self.timer.timeout.connect(self._fire)
+        wake_at = self.schedule.next_wake()
+        if wake_at is None:
+            self.timer.stop()
+        else:
+            self.timer.start(max(0, math.ceil((wake_at - time.monotonic()) * 1000)))
+
+    def _fire(self):
+        self.wakeups += 1
+        self.firing = True
+        try:
+            for ticker in self.schedule.pop_due(time.monotonic() + self.COALESCE):
+                ticker.tick()
+        finally:
+            self.firing = False
+        self._arm()
+
+countdown_manager = CountdownManager()
+
+class CountdownTicker:
+    """Wakes a countdown display right after each displayed second changes.
+
+    Each tick runs the callback, then re-reads the wall clock and books the
+    next boundary (see countdown_clock) with the shared CountdownManager.
+    While the widget is hidden or minimized it only wakes once a minute, and
+    at the target itself so the finish still fires on time. Call start()
+    again when visibility or the target changes.
+    """
+    def __init__(self, widget, target_func, callback, manager=None):
+        self.widget = widget
+        self.target_func = target_func
+        self.callback = callback
+        self.manager = manager or countdown_manager
+        self.wakeups = 0
+
+    def start(self):
+        self.tick()
+
+    def stop(self):
+        self.manager.remove(self)
+
+    def is_active(self):
+        return self in self.manager.schedule
+
+    def tick(self):
+        self.wakeups += 1
+        self.callback()
+        visible = self.widget.isVisible() and not self.widget.isMinimized()
+        delay = next_delay(remaining_seconds(self.target_func()), 1.0 if visible else HIDDEN_RESOLUTION)
+        if delay is None:
+            self.manager.remove(self)
+        else:
+            self.manager.add(self, delay)
+
+class TextFitter:
+    """Finds the largest point size at which a line of text fits a box.
+
+    Every digit is measured as the family's widest digit, so "01:04:45" and
+    "23:59:59" share one cached measurement and a ticking countdown reuses
+    it. Sizes are found by binary search over cached (shape, size) widths and
+    heights: a new shape costs a handful of metric calls, a repeat costs none.
+    """
+    _by_family = {}
+
+    @classmethod
+    def for_family(cls, family, weight=QFont.Bold):
+        fitter = cls._by_family.get((family, weight))
+        if fitter is None:
+            fitter = cls._by_family[(family, weight)] = cls(family, weight)
+        return fitter
+
+    def __init__(self, family, weight=QFont.Bold):
+        self.family = family
+        self.weight = weight
+        self.sizes = {}
+        self.digits = None
+        self.metric_calls = 0
+
+    def shape(self, text):
+        if self.digits is None:
+            fm = QFontMetrics(QFont(self.family, 48, self.weight))
+            widest = max("0123456789", key=fm.horizontalAdvance)
+            self.digits = str.maketrans("0123456789", widest * 10)
+        return text.translate(self.digits)
+
+    def measure(self, shape, size):
+        key = (shape, size)
+        rect = self.sizes.get(key)
+        if rect is None:
+            self.metric_calls += 1
+            r = QFontMetrics(QFont(self.family, size, self.weight)).boundingRect(shape)
+            rect = self.sizes[key] = (r.width(), r.height())
+        return rect
+
+    def fit(self, text, max_size, min_size, avail_w, avail_h):
+        # Largest size in [min_size, max_size] within avail_w x avail_h, else min_size
+        shape = self.shape(text)
+        def fits(size):
+            w, h = self.measure(shape, size)
+            return w <= avail_w and h <= avail_h
+        if max_size <= min_size or fits(max_size):
+            return max_size
+        lo, hi = min_size, max_size - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if fits(mid):
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+class GlyphAtlas:
+    """The countdown's eleven glyphs rasterized once for one font, colour and pixel ratio.
+
+    Each glyph is a transparent pixmap as tall as the font's line and as wide
+    as its advance plus `pad` on either side, drawn with the baseline at the
+    font's ascent, so painting one is a single blit.
+    """
+    GLYPHS = "0123456789:"
+
+    def __init__(self, key, font, color, dpr, pad):
+        self.key = key
+        self.dpr = dpr
+        self.pad = pad
+        fm = QFontMetricsF(font)
+        height = math.ceil(fm.height())
+        self.pixmaps = {}
+        for ch in self.GLYPHS:
+            width = math.ceil(fm.horizontalAdvance(ch)) + 2 * pad
+            pixmap = QPixmap(math.ceil(width * dpr), math.ceil(height * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(QPointF(pad, fm.ascent()), ch)
+            painter.end()
+            self.pixmaps[ch] = pixmap
+
+class GlyphAtlasCache:
+    """Size-bounded LRU of GlyphAtlases shared by every countdown display.
+
+    Displays keep a reference to the atlas they paint with, so discarding one
+    here (a display's font size changed) only stops it being handed out again.
+    """
+    def __init__(self, maxsize=GLYPH_ATLAS_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.built = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, font, color, dpr, pad):
+        key = (font.key(), color.rgba(), dpr, pad)
+        atlas = self._entries.get(key)
+        if atlas is None:
+            self.built += 1
+            atlas = self._entries[key] = GlyphAtlas(key, font, color, dpr, pad)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(key)
+        return atlas
+
+    def discard(self, atlas):
+        if self._entries.get(atlas.key) is atlas:
+            del self._entries[atlas.key]
+
+glyph_atlases = GlyphAtlasCache()
+
+class CountdownDisplay(QWidget):
+    """The countdown's "HH:MM:SS", drawn one fixed-width cell per character.
+
+    Every digit gets the width of the font's widest digit, so the cells stay
+    put while the time changes. setText() only invalidates the cells whose
+    character changed, which on most ticks is just the seconds digit; the rest
+    of the widget, and in overlay mode the rest of the window, isn't repainted.
+    Glyphs are blitted from a shared GlyphAtlas rather than shaped and
+    rasterized on every paint; a font change (the overlay was resized) drops
+    the old atlas. Stands in for the QLabel it replaced: text(), setText(),
+    setAlignment() and the stylesheet's colours and background work the same
+    way.
+    """
+    DIGITS = "0123456789"
+    # Glyphs can overhang their advance a little; dirty rects include this much
+    OVERHANG = 2
+
+    def __init__(self, text="", parent=None):
+        super().__init__(parent)
+        self._text = text
+        self.alignment = Qt.AlignCenter
+        self.cells = None
+        self.starts = None
+        self.positions = None
+        self.top = 0
+        self.metrics = None
+        self.atlas = None
+
+    def text(self):
+        return self._text
+
+    def setText(self, text):
+        old = self._text
+        if text == old:
+            return
+        self._text = text
+        if self.cells is None or len(text) != len(old) or any(
+                self._cell_width(a) != self._cell_width(b) for a, b in zip(text, old) if a != b):
+            # Cell widths change; lay out again
+            self._invalidate()
+            return
+        fm, _ = self._metrics()
+        for i, (a, b) in enumerate(zip(text, old)):
+            if a != b:
+                # Same cell, new glyph: centre it again
+                self.positions[i] = self.starts[i] + (self._cell_width(a) - fm.horizontalAdvance(a)) / 2
+                self.update(self.cells[i].adjusted(-self.OVERHANG, 0, self.OVERHANG, 0))
+
+    def setAlignment(self, alignment):
+        if alignment != self.alignment:
+            self.alignment = alignment
+            self._invalidate()
+
+    def _invalidate(self):
+        self.cells = None
+        self.updateGeometry()
+        self.update()
+
+    def _metrics(self):
+        if self.metrics is None:
+            fm = QFontMetricsF(self.font())
+            self.metrics = (fm, max(fm.horizontalAdvance(d) for d in self.DIGITS))
+        return self.metrics
+
+    def _cell_width(self, ch):
+        fm, digit_w = self._metrics()
+        return digit_w if ch in self.DIGITS else fm.horizontalAdvance(ch)
+
+    def _layout(self):
+        fm, _ = self._metrics()
+        widths = [self._cell_width(ch) for ch in self._text]
+        area = self.contentsRect()
+        total, height = sum(widths), fm.height()
+        if self.alignment & Qt.AlignLeft:
+            x = area.left()
+        elif self.alignment & Qt.AlignRight:
+            x = area.right() + 1 - total
+        else:
+            x = area.left() + (area.width() - total) / 2
+        y = area.top() + (area.height() - height) / 2
+        self.cells, self.starts, self.positions = [], [], []
+        for ch, w in zip(self._text, widths):
+            # Each glyph is centred in its cell
+            self.starts.append(x)
+            self.positions.append(x + (w - fm.horizontalAdvance(ch)) / 2)
+            self.cells.append(QRectF(x, y, w, height).toAlignedRect())
+            x += w
+        self.top = y
+
+    def sizeHint(self):
+        fm, _ = self._metrics()
+        width = sum(self._cell_width(ch) for ch in self._text)
+        margins = self.contentsMargins()
+        return QSize(math.ceil(width) + margins.left() + margins.right(),
+                     math.ceil(fm.height()) + margins.top() + margins.bottom())
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self.metrics = None
+            if self.atlas is not None:
+                glyph_atlases.discard(self.atlas)
+            self.atlas = None
+            self._invalidate()
+        elif event.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            # New text colour; the old atlas stays cached for switching back
+            self.atlas = None
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.cells = None
+
+    def paintEvent(self, event):
+        if self.cells is None:
+            self._layout()
+        painter = QPainter(self)
+        # Stylesheet background, clipped to the dirty region like everything else
+        opt = QStyleOption()
+        opt.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, opt, painter, self)
+        color = self.palette().color(self.foregroundRole())
+        dpr = self.devicePixelRatioF()
+        if self.atlas is None or self.atlas.dpr != dpr:
+            self.atlas = glyph_atlases.get(self.font(), color, dpr, self.OVERHANG)
+        pixmaps = self.atlas.pixmaps
+        region = event.region()
+        top = round(self.top)
+        for ch, x, cell in zip(self._text, self.positions, self.cells):
+            if not region.intersects(cell.adjusted(-self.OVERHANG, 0, self.OVERHANG, 0)):
+                continue
+            pixmap = pixmaps.get(ch)
+            if pixmap is not None:
+                painter.drawPixmap(round(x) - self.OVERHANG, top, pixmap)
             else:
-                return f"QPushButton {{ background: {self.toggle_on_bg}; color: {self.toggle_on_fg}; {base} }}"
+                # Not a countdown glyph; draw it the slow way
+                painter.setPen(color)
+                painter.setFont(self.font())
+                painter.drawText(QPointF(x, self.top + self._metrics()[0].ascent()), ch)
+        painter.end()
+
+# Extra item data roles on the zone models
+ZONE_NAME_ROLE = Qt.UserRole
+CUSTOM_OFFSET_ROLE = Qt.UserRole + 1
+PICKED_ZONE_ROLE = Qt.UserRole + 2
+
+def custom_offset_label(offset):
+    sign = '+' if offset >= 0 else '-'
+    return f"UTC{sign}{abs(offset)}"
+
+class TimezoneListModel(QAbstractListModel):
+    """TIMEZONES plus "UTC Custom" and "More zones..." rows, shared by every picker.
+
+    Labels are only formatted when a view first asks for them. Per-picker
+    state (the custom offset, the zone picked from the full catalog) lives in
+    a CustomOffsetProxy on top of this.
+    """
+    _shared = None
+
+    @classmethod
+    def shared(cls):
+        if cls._shared is None:
+            cls._shared = cls(TIMEZONES)
+        return cls._shared
+
+    def __init__(self, timezones, parent=None):
+        super().__init__(parent)
+        self.timezones = timezones
+        self.labels = [None] * len(timezones)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.timezones) + 2
+
+    def label(self, row):
+        label = self.labels[row]
+        if label is None:
+            abbr, dst_abbr, _, _, loc, _ = self.timezones[row]
+            # Show both standard and DST abbrev/offset, and region in brackets
+            label = self.labels[row] = f"{abbr} / {dst_abbr} ({loc})"
+        return label
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row == len(self.timezones):
+            if role == Qt.DisplayRole:
+                return "UTC Custom"
+            if role == Qt.ToolTipRole:
+                return "Custom UTC offset"
+            return None
+        if row == len(self.timezones) + 1:
+            if role == Qt.DisplayRole:
+                return "More zones..."
+            if role == Qt.ToolTipRole:
+                return "Search every IANA timezone"
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self.label(row)
+        if role == ZONE_NAME_ROLE:
+            return self.timezones[row][5]
+        return None
+
+class CustomOffsetProxy(QIdentityProxyModel):
+    """One picker's view of the shared zone model.
+
+    Holds that picker's custom offset (CUSTOM_OFFSET_ROLE on the custom row)
+    and shows it as the row's label, e.g. "UTC+5", and likewise the zone
+    picked from the full catalog (PICKED_ZONE_ROLE on the "More zones" row).
+    """
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.setSourceModel(source)
+        self.custom_offset = None
+        self.picked_zone = None
+
+    def custom_row(self):
+        return self.rowCount() - 2
+
+    def search_row(self):
+        return self.rowCount() - 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row() if index.isValid() else -1
+        if row == self.custom_row():
+            if role == CUSTOM_OFFSET_ROLE:
+                return self.custom_offset
+            if role == Qt.DisplayRole and self.custom_offset is not None:
+                return custom_offset_label(self.custom_offset)
+        elif row == self.search_row():
+            if role in (PICKED_ZONE_ROLE, ZONE_NAME_ROLE):
+                return self.picked_zone
+            if role == Qt.DisplayRole and self.picked_zone is not None:
+                return self.picked_zone
+        return super().data(index, role)
+
+    def setData(self, index, value, role=Qt.EditRole):
+        row = index.row() if index.isValid() else -1
+        if row == self.custom_row() and role == CUSTOM_OFFSET_ROLE:
+            self.custom_offset = value
+        elif row == self.search_row() and role == PICKED_ZONE_ROLE:
+            self.picked_zone = value
         else:
-            return f"QPushButton {{ background: {self.button_bg}; color: {self.button_fg}; {base} }} QPushButton:pressed {{ background: {self.button_fg}; color: {self.button_bg}; }}"
+            return False
+        self.dataChanged.emit(index, index, [role, Qt.DisplayRole])
+        return True
 
 class TimezoneComboBox(QComboBox):
     def __init__(self, parent=None):
@@ -164,15 +797,26 @@ class TimezoneComboBox(QComboBox):
         self.setView(QListView())
         self.setFont(QFont("Segoe UI", 14))  # Increased font size
         self.setMinimumWidth(260)
-        for abbr, dst_abbr, offset_std, offset_dst, loc, pytz_name in TIMEZONES:
-            # Show both standard and DST abbrev/offset, and region in brackets
-            label = f"{abbr} / {dst_abbr} ({loc})"
-            self.addItem(label)
-            self.setItemData(self.count()-1, label, Qt.DisplayRole)
-            self.setItemData(self.count()-1, label, Qt.ToolTipRole)
-        self.addItem("UTC Custom")
-        self.setItemData(self.count()-1, "UTC Custom", Qt.DisplayRole)
-        self.setItemData(self.count()-1, "Custom UTC offset", Qt.ToolTipRole)
+        self.setModel(CustomOffsetProxy(TimezoneListModel.shared(), self))
+
+    def custom_row(self):
+        return self.model().custom_row()
+
+    def search_row(self):
+        return self.model().search_row()
+
+    def set_custom_offset(self, offset):
+        self.model().setData(self.model().index(self.custom_row(), 0), offset, CUSTOM_OFFSET_ROLE)
+
+    def picked_zone(self):
+        return self.model().picked_zone
+
+    def set_picked_zone(self, name):
+        self.model().setData(self.model().index(self.search_row(), 0), name, PICKED_ZONE_ROLE)
+
+    def has_zone(self):
+        # False while "More zones..." is selected but nothing has been picked yet
+        return self.currentIndex() >= 0 and (self.currentIndex() != self.search_row() or self.picked_zone() is not None)
 
 class SnappableWidget(QWidget):
     def __init__(self, *args, **kwargs):
@@ -229,13 +873,164 @@ class CustomUTCDialog(QDialog):
             val = 0
         return sign * val
 
+class ZoneSearchModel(QAbstractListModel):
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.results = []
+
+    def set_query(self, query):
+        self.beginResetModel()
+        self.results = self.catalog.search(query)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.results)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.results[index.row()]
+        if role == Qt.DisplayRole:
+            return self.catalog.label(entry)
+        if role == ZONE_NAME_ROLE:
+            return entry.name
+        return None
+
+class ZoneSearchDialog(SnappableDialog):
+    """Type-to-filter picker over every IANA zone (see zone_catalog).
+
+    The catalog is built the first time this opens, not at startup. Each
+    keystroke is an index lookup that re-ranks only the matching zones.
+    """
+    def __init__(self, parent=None, initial=None):
+        super().__init__(parent)
+        self.setWindowTitle("Find a timezone")
+        self.setWindowIcon(QIcon(APP_ICON_PATH))
+        self.resize(460, 420)
+        theme = parent.theme_mgr.theme if hasattr(parent, "theme_mgr") else get_theme(getattr(parent, "settings", None))
+        self.theme_mgr = ThemeManager(theme)
+        self.setStyleSheet(self.theme_mgr.widget_stylesheet())
+        themed.add(self, "window")
+        layout = QVBoxLayout()
+        self.query = QLineEdit()
+        self.query.setPlaceholderText("City, region, abbreviation or offset (e.g. +5:30)")
+        layout.addWidget(self.query)
+        self.results = QListView()
+        self.model = ZoneSearchModel(get_catalog(ZONE_CATALOG_CACHE_PATH), self)
+        self.results.setModel(self.model)
+        layout.addWidget(self.results)
+        self.setLayout(layout)
+        self.query.textChanged.connect(self.update_results)
+        self.query.returnPressed.connect(self.accept)
+        self.results.doubleClicked.connect(self.accept)
+        self.query.installEventFilter(self)
+        self.query.setText(initial or "")
+        self.update_results(self.query.text())
+
+    def update_results(self, text):
+        self.model.set_query(text)
+        if self.model.rowCount():
+            self.results.setCurrentIndex(self.model.index(0, 0))
+
+    def eventFilter(self, obj, event):
+        # Up/Down in the search box move through the results
+        if obj is self.query and event.type() == QEvent.KeyPress and event.key() in (Qt.Key_Up, Qt.Key_Down):
+            row = self.results.currentIndex().row() + (1 if event.key() == Qt.Key_Down else -1)
+            if 0 <= row < self.model.rowCount():
+                self.results.setCurrentIndex(self.model.index(row, 0))
+            return True
+        return super().eventFilter(obj, event)
+
+    def selected_zone(self):
+        index = self.results.currentIndex()
+        return index.data(ZONE_NAME_ROLE) if index.isValid() else None
+
+class WorldClockPanel(SnappableDialog):
+    """The time right now in every TIMEZONES row, plus any custom UTC offsets.
+
+    One wakeup per minute through the shared countdown_manager reads a single
+    UTC instant for all rows (see world_clock), and only labels whose text
+    changed get setText(). Hidden panels aren't woken at all.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowFlag(Qt.Tool, True)
+        self.setWindowTitle("World clock")
+        self.setWindowIcon(QIcon(APP_ICON_PATH))
+        theme = parent.theme_mgr.theme if hasattr(parent, "theme_mgr") else get_theme(getattr(parent, "settings", None))
+        self.theme_mgr = ThemeManager(theme)
+        self.setStyleSheet(self.theme_mgr.widget_stylesheet())
+        themed.add(self, "window")
+        self.grid = QGridLayout()
+        self.grid.setHorizontalSpacing(14)
+        self.setLayout(self.grid)
+        self.clock = WorldClock()
+        self.rows = []
+        self.custom_offsets = ()
+        names = TimezoneListModel.shared()
+        for row, tz in enumerate(timezone_tzinfos()):
+            self._add_row(names.label(row), tz)
+        self.wakeups = 0
+        self.finished.connect(lambda *args: countdown_manager.remove(self))
+
+    def _add_row(self, name, tz):
+        row = self.clock.add(name, tz)
+        labels = {"name": QLabel(name)}
+        for field in WORLD_CLOCK_FIELDS:
+            labels[field] = QLabel()
+        labels["time"].setFont(QFont("Segoe UI", 12, QFont.Bold))
+        for column, key in enumerate(("name",) + WORLD_CLOCK_FIELDS):
+            self.grid.addWidget(labels[key], row, column)
+        self.rows.append(labels)
+
+    def set_custom_offsets(self, offsets):
+        # Custom rows sit below the TIMEZONES rows; rebuild them only if they changed
+        offsets = tuple(dict.fromkeys(o for o in offsets if o is not None))
+        if offsets == self.custom_offsets:
+            return
+        self.custom_offsets = offsets
+        while len(self.rows) > len(TIMEZONES):
+            for label in self.rows.pop().values():
+                self.grid.removeWidget(label)
+                label.deleteLater()
+            self.clock.remove(len(self.rows))
+        for offset in offsets:
+            self._add_row(custom_offset_label(offset), FixedOffset(offset))
+        if self.isVisible():
+            self.tick()
+
+    def tick(self):
+        self.wakeups += 1
+        for row, field, text in self.clock.changes():
+            self.rows[row][field].setText(text)
+        if self.isVisible() and not self.isMinimized():
+            countdown_manager.add(self, world_clock_delay())
+        else:
+            countdown_manager.remove(self)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.tick()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        countdown_manager.remove(self)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.tick()
+
 class TimezoneConverter(SnappableWidget):
     def __init__(self):
         super().__init__()
         self.settings = load_settings()
+        startup.mark("settings_load")
         self.theme = get_theme(self.settings)
         self.theme_mgr = ThemeManager(self.theme)
         self.theme_mgr.settings = self.settings
+        startup.mark("theme_detection")
         self.setWindowTitle("Shitty Timezone Converter")
         self.setWindowIcon(QIcon(APP_ICON_PATH))
         # Calculate minimum width for text boxes + combo boxes + spacing
@@ -244,6 +1039,10 @@ class TimezoneConverter(SnappableWidget):
         self.move(*self.settings.get("main_window_pos", [100, 100]))
         self.resize(*self.settings.get("main_window_size", [max(min_width, 700), 370]))
         self.setStyleSheet(self.theme_mgr.widget_stylesheet())
+        themed.add(self, "window")
+        self.system_theme = SystemThemeRelay(self)
+        self.system_theme.changed.connect(self._on_system_theme_changed)
+        theme_watcher.start(self.system_theme.changed.emit)
         self.init_ui()
         # System tray icon for minimize/restore
         self.tray_icon = QSystemTrayIcon(QIcon(APP_ICON_PATH), self)
@@ -257,15 +1056,22 @@ class TimezoneConverter(SnappableWidget):
         tray_menu.addAction(quit_action)
         self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.activated.connect(self.tray_activated)
-        # --- Connect time/date changes to countdown update ---
-        self.date_entry.textChanged.connect(self._update_countdown_if_open)
-        self.time_entry.textChanged.connect(self._update_countdown_if_open)
-        self.src_tz.currentIndexChanged.connect(self._update_countdown_if_open)
-        self.dst_tz.currentIndexChanged.connect(self._update_countdown_if_open)
         self.custom_src_offset = None
         self.custom_dst_offset = None
+        # Rendered results for recently used zone pairs/times; see result_cache.stats()
+        self.result_cache = ConversionCache(maxsize=RESULT_CACHE_SIZE)
+        # Extra countdowns pinned with Shift+click, alongside self.countdown_dialog
+        self.pinned_countdowns = []
         self.src_tz.activated.connect(lambda idx: self._handle_custom_tz(idx, True))
         self.dst_tz.activated.connect(lambda idx: self._handle_custom_tz(idx, False))
+        startup.mark("window_setup")
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not startup.has("first_paint"):
+            startup.mark("first_paint")
+            if startup.write_report() and startup.exit_requested():
+                QTimer.singleShot(0, QApplication.instance().quit)
 
     def tray_activated(self, reason):
         if reason == QSystemTrayIcon.Trigger:
@@ -314,21 +1120,9 @@ class TimezoneConverter(SnappableWidget):
         now = datetime.now()
         self.default_time = f"{now.hour:02}:{now.minute:02}"
         self.time_entry.setText(self.default_time)
-        # Always set stylesheet for QLineEdit based on theme colors from ThemeManager
-        edit_fg = self.theme_mgr.edit_fg if hasattr(self, 'theme_mgr') else ('#fff' if self.theme == 'dark' else '#222')
-        box_bg = self.theme_mgr.box if hasattr(self, 'theme_mgr') else ('#222' if self.theme == 'dark' else '#fff')
-        if self.theme == "dark":
-            self.time_entry.setStyleSheet("""
-                color: #fff;
-                font-weight: bold;
-                background: #222;
-                selection-background-color: #444;
-                selection-color: #fff;
-            """
-            "QLineEdit:placeholder { color: #eee; font-weight: bold; }"
-            )
-        else:
-            self.time_entry.setStyleSheet(f"color: {edit_fg}; font-weight: bold; background: {box_bg};")
+        # Restyled with the rest of the window on every theme switch
+        self.time_entry.setStyleSheet(self.theme_mgr.styles.time_entry)
+        themed.add(self.time_entry, "time_entry")
         input_row.addWidget(self.time_entry)
         self.time_entry.textChanged.connect(self.time_autofmt)
         # Focus cursor to time_entry at position 0 and select all after window is shown
@@ -342,34 +1136,12 @@ class TimezoneConverter(SnappableWidget):
             if text == self.default_time:
                 self.time_entry.setStyleSheet("color: #888; font-weight: normal;")
             elif text:
-                if self.theme == "dark":
-                    self.time_entry.setStyleSheet("""
-                        color: #fff;
-                        font-weight: bold;
-                        background: #222;
-                        selection-background-color: #444;
-                        selection-color: #fff;
-                    """
-                    "QLineEdit:placeholder { color: #eee; font-weight: bold; }"
-                    )
-                else:
-                    self.time_entry.setStyleSheet(f"color: {edit_fg}; font-weight: bold; background: {box_bg};")
+                self.time_entry.setStyleSheet(self.theme_mgr.styles.time_entry)
         self.time_entry.textChanged.connect(on_time_entry_change)
         def on_time_entry_first_input():
             if self.time_entry.text() == self.default_time:
                 self.time_entry.clear()
-                if self.theme == "dark":
-                    self.time_entry.setStyleSheet("""
-                        color: #fff;
-                        font-weight: bold;
-                        background: #222;
-                        selection-background-color: #444;
-                        selection-color: #fff;
-                    """
-                    "QLineEdit:placeholder { color: #eee; font-weight: bold; }"
-                    )
-                else:
-                    self.time_entry.setStyleSheet(f"color: {edit_fg}; font-weight: bold; background: {box_bg};")
+                self.time_entry.setStyleSheet(self.theme_mgr.styles.time_entry)
                 self.time_entry.textChanged.disconnect(on_time_entry_first_input)
         self.time_entry.textChanged.connect(on_time_entry_first_input)
 
@@ -394,9 +1166,15 @@ class TimezoneConverter(SnappableWidget):
         # Icons row
         icons_row = QHBoxLayout()
         self.clock_btn = QPushButton("\U0001F551")  # 
-        self.clock_btn.setToolTip("Show countdown")
+        self.clock_btn.setToolTip("Show countdown (Shift+click to pin another one)")
         self.clock_btn.setStyleSheet(self.theme_mgr.button_stylesheet(symbol=True))
+        themed.add(self.clock_btn, "symbol")
         icons_row.addWidget(self.clock_btn)
+        self.world_btn = QPushButton("\U0001F310")  # Globe
+        self.world_btn.setToolTip("World clock")
+        self.world_btn.setStyleSheet(self.theme_mgr.button_stylesheet(symbol=True))
+        themed.add(self.world_btn, "symbol")
+        icons_row.addWidget(self.world_btn)
         icon_color = self.theme_mgr.symbol
         # Create a pixmap for the question mark icon
         from PyQt5.QtGui import QPixmap, QPainter, QColor
@@ -414,106 +1192,40 @@ class TimezoneConverter(SnappableWidget):
         self.about_btn.setIconSize(pixmap.size())
         self.about_btn.setText("")  # Remove text so only icon shows
         self.about_btn.setStyleSheet(self.theme_mgr.button_stylesheet(symbol=True))
+        themed.add(self.about_btn, "symbol")
         icons_row.addWidget(self.about_btn)
         icons_row.addStretch()
         layout.addLayout(icons_row)
 
         self.setLayout(layout)
 
-        # Connect events
-        self.src_tz.currentIndexChanged.connect(self.update_result)
-        self.dst_tz.currentIndexChanged.connect(self.update_result)
-        self.date_entry.textChanged.connect(self.update_result)
-        self.time_entry.textChanged.connect(self.update_result)
-        self.clock_btn.clicked.connect(self.show_countdown)
+        # Connect events; every input change funnels into one coalesced recompute
+        # that refreshes the result and any open countdown
+        self.recompute = RecomputeScheduler(self, self._input_key, [self.update_result, self._update_countdown_if_open])
+        self.src_tz.currentIndexChanged.connect(self.recompute.schedule)
+        self.dst_tz.currentIndexChanged.connect(self.recompute.schedule)
+        self.date_entry.textChanged.connect(self.recompute.schedule)
+        self.time_entry.textChanged.connect(self.recompute.schedule)
+        self.clock_btn.clicked.connect(self._on_clock_clicked)
         self.about_btn.clicked.connect(self.show_about)
+        self.world_btn.clicked.connect(self.show_world_clock)
 
         # Set default date to today
         self.date_entry.setText(f"{now.month:02}/{now.day:02}")
 
+        startup.mark("ui_build")
+
         # Default destination timezone to user's system timezone if available
-        import tzlocal
-        import pytz
-        import json
         try:
-            local_tz = tzlocal.get_localzone_name()
-            found = False
-            # Try exact match first
-            for i in range(self.dst_tz.count()):
-                if local_tz in self.dst_tz.itemText(i) or local_tz.replace('_', ' ') in self.dst_tz.itemText(i):
-                    self.dst_tz.setCurrentIndex(i)
-                    found = True
-                    break
-            # If not found, try robust offset-based fallback
-            if not found:
-                # Get current system offset (including DST)
-                now = datetime.now(pytz.timezone(local_tz))
-                offset_td = now.utcoffset()
-                if offset_td is not None:
-                    total_minutes = int(offset_td.total_seconds() // 60)
-                    hours = total_minutes // 60
-                    minutes = abs(total_minutes % 60)
-                    sign = '+' if total_minutes >= 0 else '-'
-                    offset_str = f"{sign}{abs(hours):02}:{minutes:02}"
-                    # Load offset map
-                    try:
-                        with open(OFFSET_DB_PATH, 'r', encoding='utf-8') as f:
-                            offset_map = json.load(f)
-                        zones = offset_map.get(offset_str)
-                        if not zones and offset_str.startswith('+0'):
-                            zones = offset_map.get('+00:00')
-                        if zones:
-                            # Try to determine region/country from system locale
-                            system_region = None
-                            try:
-                                # Use getlocale() and fallback to environment if needed
-                                loc = locale.getlocale()
-                                if (not loc or not loc[0]) and hasattr(locale, 'getdefaultlocale'):
-                                    loc = locale.getdefaultlocale()
-                                # Try environment variables as last resort
-                                if (not loc or not loc[0]):
-                                    import os
-                                    env_vars = [os.environ.get('LANG'), os.environ.get('LC_ALL'), os.environ.get('LC_CTYPE')]
-                                    for env in env_vars:
-                                        if env and '_' in env:
-                                            loc = (env, None)
-                                            break
-                                if loc and loc[0]:
-                                    # e.g. 'en_ZA' -> 'ZA'
-                                    system_region = loc[0].split('_')[-1].split('.')[0]
-                            except Exception:
-                                pass
-                            # Reorder zones so that the one closest to the system locale is first
-                            def region_score(zone, region):
-                                # Score: 0 = perfect match, 1 = region in zone name, 2 = region in label, 3 = no match
-                                for idx, (abbr, dst_abbr, offset_std, offset_dst, loc_name, pytz_name) in enumerate(TIMEZONES):
-                                    if zone == pytz_name:
-                                        if region:
-                                            if region.lower() in pytz_name.lower():
-                                                return 0
-                                            if region.lower() in loc_name.lower():
-                                                return 1
-                                        return 2
-                                return 3
-                            if system_region:
-                                zones = sorted(zones, key=lambda z: region_score(z, system_region))
-                            # For each candidate IANA zone, find its index in TIMEZONES
-                            for zone in zones:
-                                for idx, (abbr, dst_abbr, offset_std, offset_dst, loc_name, pytz_name) in enumerate(TIMEZONES):
-                                    if zone == pytz_name:
-                                        label = f"{abbr} / {dst_abbr} ({loc_name})"
-                                        for i in range(self.dst_tz.count()):
-                                            if self.dst_tz.itemText(i) == label:
-                                                self.dst_tz.setCurrentIndex(i)
-                                                found = True
-                                                break
-                                if found:
-                                    break
-                    except Exception as e:
-                        pass
+            row = detect_local_row(OFFSET_DB_PATH, LOCAL_ZONE_CACHE_PATH)
+            if row is not None:
+                # Combo rows mirror TIMEZONES, so the row is the combo index
+                self.dst_tz.setCurrentIndex(row)
         except Exception:
             pass
 
+        startup.mark("zone_detection")
+
         # --- Clear date or time entry on user click (fixed: no tuple return) ---
         def make_clear_on_click(entry):
             orig_event = entry.mousePressEvent
@@ -542,94 +1254,83 @@ class TimezoneConverter(SnappableWidget):
             self.time_entry.setText(text[:5])
 
     def update_result(self):
-        src_idx = self.src_tz.currentIndex()
-        dst_idx = self.dst_tz.currentIndex()
         date_str = self.date_entry.text().strip()
         time_str = self.time_entry.text().strip()
         # Only show result if user has entered a time different from the default
-        if src_idx < 0 or dst_idx < 0 or not time_str or time_str == getattr(self, 'default_time', None):
+        if not self.src_tz.has_zone() or not self.dst_tz.has_zone() or not time_str or time_str == getattr(self, 'default_time', None):
             self.result_label.setText("Enter all fields to see result.")
             if hasattr(self, 'dst_note_label'):
                 self.dst_note_label.setText("")
             return
         try:
-            now = datetime.now()
-            # If no date entered, use current date
-            if date_str:
-                dt = parser.parse(f"{now.year}/{date_str} {time_str}")
-            else:
-                dt = parser.parse(f"{now.year}/{now.month:02}/{now.day:02} {time_str}")
-            # Handle custom UTC for src
-            if self.src_tz.currentText().startswith("UTC") and self.custom_src_offset is not None:
-                import pytz
-                from datetime import timedelta, tzinfo
-                class FixedOffset(tzinfo):
-                    def __init__(self, offset):
-                        self.__offset = timedelta(hours=offset)
-                    def utcoffset(self, dt):
-                        return self.__offset
-                    def tzname(self, dt):
-                        return f"UTC{'+' if self.__offset.total_seconds() >= 0 else '-'}{abs(int(self.__offset.total_seconds()//3600))}"
-                    def dst(self, dt):
-                        return timedelta(0)
-                src_tz = FixedOffset(self.custom_src_offset)
-                src_dt = dt.replace(tzinfo=src_tz)
-            else:
-                src_abbr, src_dst_abbr, _, _, _, src_pytz = TIMEZONES[src_idx]
-                import pytz
-                src_tz = pytz.timezone(src_pytz)
-                src_dt = src_tz.localize(dt)
-            # Handle custom UTC for dst
-            if self.dst_tz.currentText().startswith("UTC") and self.custom_dst_offset is not None:
-                dst_offset = self.custom_dst_offset
-                dst_tz = FixedOffset(dst_offset)
-                dst_dt = src_dt.astimezone(dst_tz)
-                dst_str = dst_dt.strftime('%m/%d %H:%M') + f' UTC{dst_offset:+d}'
-            else:
-                dst_abbr, dst_dst_abbr, _, _, _, dst_pytz = TIMEZONES[dst_idx]
-                import pytz
-                dst_tz = pytz.timezone(dst_pytz)
-                dst_dt = src_dt.astimezone(dst_tz)
-                dst_str = dst_dt.strftime('%m/%d %H:%M') + f' {dst_dt.tzname()}'
-            delta = dst_dt - src_dt
-            # DST note logic
-            is_dst = False
-            try:
-                is_dst = bool(src_dt.dst()) or bool(dst_dt.dst())
-            except Exception:
-                pass
-            dst_note = ''
-            if abs(delta.total_seconds()) > 0:
-                sign = '+' if delta.total_seconds() > 0 else '-'
-                h = abs(int(delta.total_seconds()) // 3600)
-                m = abs(int(delta.total_seconds()) % 3600 // 60)
-                dst_note = f" (UTC{sign}{h:02}:{m:02})"
-            # If negative, show futility message
-            if delta.total_seconds() < 0:
-                neg = str(abs(delta)).split('.')[0]
-                color = self.theme_mgr.negative
-                self.result_label.setText(f"<span style='color:{color};font-weight:bold;font-size:32pt;'>YOU'RE TOO LATE HARRY, YOU ALWAYS WERE.<br>Fucked up by {neg}</span>{dst_note}")
+            src = self._zone_spec(self.src_tz, self.custom_src_offset)
+            dst = self._zone_spec(self.dst_tz, self.custom_dst_offset)
+            dt = parse_input(date_str, time_str)
+            # Rendered markup depends on the theme colours as well as the inputs
+            key = self.result_cache.key(src, dst, dt) + (self.theme_mgr.theme,)
+            cached = self.result_cache.get(key)
+            if cached is None:
+                result = convert_datetime(dt, src, dst)
+                cached = (result,) + self.render_result(result)
+                self.result_cache.put(key, cached)
+            _, result_html, note = cached
+            self.result_label.setText(result_html)
+            if note is None:
                 if hasattr(self, 'dst_note_label'):
                     self.dst_note_label.setText("")
                 return
-            h, rem = divmod(int(delta.total_seconds()), 3600)
-            m, s = divmod(rem, 60)
-
-            self.result_label.setText(f"<span style='font-size:32pt;font-weight:bold'>{src_dt.strftime('%m/%d %H:%M')} {src_dt.tzname()} → {dst_str}</span>")
             # DST note label below
             if not hasattr(self, 'dst_note_label'):
                 self.dst_note_label = QLabel()
                 self.dst_note_label.setStyleSheet("font-size:13pt;color:#888;")
                 self.result_box_layout.addWidget(self.dst_note_label)
-            if is_dst:
-                self.dst_note_label.setText("Daylight Savings Time was taken into account.")
-            else:
-                self.dst_note_label.setText("Daylight Savings Time was NOT taken into account.")
+            self.dst_note_label.setText(note)
         except Exception as e:
             self.result_label.setText(f"Invalid input: {e}")
             if hasattr(self, 'dst_note_label'):
                 self.dst_note_label.setText("")
 
+    def render_result(self, result):
+        # Returns (result markup, DST note); a None note hides the note label
+        src_dt, dst_dt = result.src_dt, result.dst_dt
+        dst_str = dst_dt.strftime('%m/%d %H:%M') + f' {result.dst_abbr}'
+        delta = dst_dt - src_dt
+        # DST note logic
+        is_dst = result.src_is_dst or result.dst_is_dst
+        dst_note = ''
+        if abs(delta.total_seconds()) > 0:
+            sign = '+' if delta.total_seconds() > 0 else '-'
+            h = abs(int(delta.total_seconds()) // 3600)
+            m = abs(int(delta.total_seconds()) % 3600 // 60)
+            dst_note = f" (UTC{sign}{h:02}:{m:02})"
+        # If negative, show futility message
+        if delta.total_seconds() < 0:
+            neg = str(abs(delta)).split('.')[0]
+            color = self.theme_mgr.negative
+            return f"<span style='color:{color};font-weight:bold;font-size:32pt;'>YOU'RE TOO LATE HARRY, YOU ALWAYS WERE.<br>Fucked up by {neg}</span>{dst_note}", None
+        result_html = f"<span style='font-size:32pt;font-weight:bold'>{src_dt.strftime('%m/%d %H:%M')} {result.src_abbr} → {dst_str}</span>"
+        if is_dst:
+            return result_html, "Daylight Savings Time was taken into account."
+        return result_html, "Daylight Savings Time was NOT taken into account."
+
+    def _input_key(self):
+        # Everything update_result depends on, normalized; an empty date means
+        # "today", so the current date is part of the key
+        return (
+            self.src_tz.currentIndex(), self.src_tz.currentText(), getattr(self, 'custom_src_offset', None),
+            self.dst_tz.currentIndex(), self.dst_tz.currentText(), getattr(self, 'custom_dst_offset', None),
+            self.date_entry.text().strip(), self.time_entry.text().strip(), datetime.now().date(),
+        )
+
+    def _zone_spec(self, combo, custom_offset):
+        # Custom UTC rows carry their offset, "More zones" its picked IANA name;
+        # everything else is a TIMEZONES row
+        if combo.currentIndex() == combo.search_row():
+            return combo.picked_zone()
+        if combo.currentIndex() == combo.custom_row() and custom_offset is not None:
+            return FixedOffset(custom_offset)
+        return combo.currentIndex()
+
     def _update_countdown_if_open(self, *args):
         # Only update if time entry has a complete value (HH:MM)
         text = self.time_entry.text().strip()
@@ -664,14 +1365,8 @@ class TimezoneConverter(SnappableWidget):
         if src_idx < 0:
             return  # No valid timezone selected
         try:
-            if date_str:
-                dt = parser.parse(f"{now.year}/{date_str} {time_str}")
-            else:
-                dt = parser.parse(f"{now.year}/{now.month:02}/{now.day:02} {time_str}")
-            src_abbr, src_dst_abbr, _, _, _, src_pytz = TIMEZONES[src_idx]
-            import pytz
-            src_tz = pytz.timezone(src_pytz)
-            src_dt = src_tz.localize(dt)
+            dt = parse_input(date_str, time_str, now)
+            src_dt = localize(dt, resolve_zone(self._zone_spec(self.src_tz, self.custom_src_offset)))
             local_dt = src_dt.astimezone()
             if hasattr(self, 'countdown_dialog') and self.countdown_dialog is not None:
                 try:
@@ -690,6 +1385,58 @@ class TimezoneConverter(SnappableWidget):
         except Exception:
             pass  # Ignore parse errors while typing
 
+    def _on_system_theme_changed(self, theme):
+        # Follow the system only while the user hasn't picked a theme
+        if self.settings.get("theme") not in ("light", "dark"):
+            themed.apply(theme, save=False)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.ApplicationPaletteChange:
+            # The OS told Qt its colours changed; see if that includes the theme
+            theme_watcher.refresh()
+
+    def _on_clock_clicked(self):
+        if QApplication.keyboardModifiers() & Qt.ShiftModifier:
+            self.add_countdown()
+        else:
+            self.show_countdown()
+
+    def add_countdown(self):
+        # Pin an extra countdown for the current inputs; unlike countdown_dialog it
+        # doesn't follow later edits, so several deadlines can run side by side
+        now = datetime.now()
+        time_str = self.time_entry.text().strip() or f"{now.hour:02}:{now.minute:02}"
+        try:
+            dt = parse_input(self.date_entry.text().strip(), time_str, now)
+            src_dt = localize(dt, resolve_zone(self._zone_spec(self.src_tz, self.custom_src_offset)))
+        except Exception:
+            return
+        title = f"{src_dt.strftime('%m/%d %H:%M')} {src_dt.tzname()}"
+        dialog = CountdownDialog(src_dt.astimezone(), parent=self, settings=self.settings, title=title)
+        # Cascade so pinned countdowns don't open on top of each other
+        offset = 30 * (len(self.pinned_countdowns) + 1)
+        dialog.move(dialog.x() + offset, dialog.y() + offset)
+        self.pinned_countdowns.append(dialog)
+        dialog.finished.connect(lambda *args: self.pinned_countdowns.remove(dialog) if dialog in self.pinned_countdowns else None)
+        dialog.show()
+
+    def show_world_clock(self):
+        # Toggles like the about dialog
+        panel = getattr(self, 'world_clock_panel', None)
+        if panel is not None and panel.isVisible():
+            panel.close()
+            self.world_clock_panel = None
+            return
+        panel = WorldClockPanel(parent=self)
+        panel.set_custom_offsets((self.custom_src_offset, self.custom_dst_offset))
+        panel.move(self.x() + self.width() + 20, self.y())
+        self.world_clock_panel = panel
+        def cleanup_world_clock():
+            self.world_clock_panel = None
+        panel.finished.connect(cleanup_world_clock)
+        panel.show()
+
     def show_about(self):
         # If the about dialog is already open and visible, close it and return
         if hasattr(self, 'about_dialog') and self.about_dialog is not None:
@@ -724,11 +1471,15 @@ class TimezoneConverter(SnappableWidget):
         self.settings["main_window_pos"] = [self.x(), self.y()]
         self.settings["main_window_size"] = [self.width(), self.height()]
         save_settings(self.settings)
+        settings_store.flush()
         super().closeEvent(event)
 
     def _handle_custom_tz(self, idx, is_src):
         combo = self.src_tz if is_src else self.dst_tz
-        if combo.itemText(idx).startswith("UTC Custom") or combo.itemText(idx).startswith("UTC+") or combo.itemText(idx).startswith("UTC-"):
+        if idx == combo.search_row():
+            self._pick_zone(combo)
+            return
+        if idx == combo.custom_row():
             initial = self.custom_src_offset if is_src else self.custom_dst_offset
             dlg = CustomUTCDialog(self, initial_offset=initial or 0)
             if dlg.exec_():
@@ -737,33 +1488,33 @@ class TimezoneConverter(SnappableWidget):
                     self.custom_src_offset = offset
                 else:
                     self.custom_dst_offset = offset
-                # Update dropdown label
-                sign = '+' if offset >= 0 else '-'
-                label = f"UTC{sign}{abs(offset)}"
-                combo.setItemText(combo.count()-1, label)
-                combo.setCurrentIndex(combo.count()-1)
+                # The custom row's label follows its offset
+                combo.set_custom_offset(offset)
+                if getattr(self, 'world_clock_panel', None) is not None:
+                    self.world_clock_panel.set_custom_offsets((self.custom_src_offset, self.custom_dst_offset))
+                combo.setCurrentIndex(combo.custom_row())
+                # The index may not have changed, but the offset has
+                self.recompute.schedule()
             else:
                 # If cancelled, revert selection
                 combo.setCurrentIndex(0)
 
+    def _pick_zone(self, combo):
+        dlg = ZoneSearchDialog(self, initial=combo.picked_zone())
+        if dlg.exec_() and dlg.selected_zone():
+            combo.set_picked_zone(dlg.selected_zone())
+            combo.setCurrentIndex(combo.search_row())
+            # The index may not have changed, but the zone has
+            self.recompute.schedule()
+        elif combo.picked_zone() is None:
+            # Nothing picked; revert selection
+            combo.setCurrentIndex(0)
+
     def on_theme_change(self):
-        if self.theme_mgr.theme == "dark":
-            self.time_entry.setStyleSheet("""
-                color: #fff;
-                font-weight: bold;
-                background: #222;
-                selection-background-color: #444;
-                selection-color: #fff;
-            """
-            "QLineEdit:placeholder { color: #eee; font-weight: bold; }"
-            )
-        else:
-            edit_fg = self.theme_mgr.edit_fg if hasattr(self, 'theme_mgr') else ('#fff' if self.theme_mgr.theme == 'dark' else '#222')
-            box_bg = self.theme_mgr.box if hasattr(self, 'theme_mgr') else ('#222' if self.theme_mgr.theme == 'dark' else '#fff')
-            self.time_entry.setStyleSheet(f"color: {edit_fg}; font-weight: bold; background: {box_bg};")
+        self.time_entry.setStyleSheet(self.theme_mgr.styles.time_entry)
 
 class CountdownDialog(SnappableDialog):
-    def __init__(self, target_dt, parent=None, settings=None):
+    def __init__(self, target_dt, parent=None, settings=None, title=None):
         super().__init__(parent)
         self.setWindowFlag(Qt.Tool, True)
         self.snapping = True
@@ -772,7 +1523,8 @@ class CountdownDialog(SnappableDialog):
         self.theme_mgr = ThemeManager(self.theme)
         self.theme_mgr.settings = self.settings
         self.theme_mgr.apply_theme = lambda: (ThemeManager.apply_theme(self.theme_mgr), parent.on_theme_change() if hasattr(parent, 'on_theme_change') else None)
-        self.setWindowTitle("Countdown")
+        self.title = title
+        self.setWindowTitle(f"Countdown - {title}" if title else "Countdown")
         self.setWindowIcon(QIcon(APP_ICON_PATH))
         self.target_dt = target_dt
         self.overlay_mode = False
@@ -789,11 +1541,11 @@ class CountdownDialog(SnappableDialog):
         # Widgets
         layout = QVBoxLayout()
         layout.setContentsMargins(8, 8, 8, 8)  # Set overlay padding here
-        self.label = QLabel("00:00:00")
+        self.label = CountdownDisplay("00:00:00")
         self.label.setAlignment(Qt.AlignCenter)
         self.label.setFont(QFont("Segoe UI", self.base_font_size, QFont.Bold))
         layout.addWidget(self.label)
-        self.info = QLabel("")
+        self.info = QLabel(title or "")
         self.info.setAlignment(Qt.AlignCenter)
         self.info.setFont(QFont("Segoe UI", 18))
         layout.addWidget(self.info)
@@ -803,31 +1555,48 @@ class CountdownDialog(SnappableDialog):
         self.overlay_btn.setToolTip("Toggle overlay mode")
         self.overlay_btn.setStyleSheet(self.theme_mgr.button_stylesheet(symbol=True))
         self.overlay_btn.clicked.connect(self.toggle_overlay)
+        themed.add(self.overlay_btn, "borderless")
         btn_row.addWidget(self.overlay_btn)
         self.options_btn = QPushButton("\u2699")  # Cogwheel symbol
         self.options_btn.setToolTip("Options")
         self.options_btn.setStyleSheet(self.theme_mgr.button_stylesheet(symbol=True))
         self.options_btn.clicked.connect(self.show_options)
+        themed.add(self.options_btn, "borderless")
         btn_row.addWidget(self.options_btn)
         layout.addLayout(btn_row)
         self.setLayout(layout)
+        themed.add(self, "window")
         # Resizing/dragging state
         self.resizing = False
         self.drag_pos = None
         self.start_geom = None
         self.resize_margin = 12  # Ensure margin for snapping
         self.setMouseTracking(True)
-        # Timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_countdown)
-        self.timer.start(1000)
-        self.update_countdown()
+        # Ticks aligned to the displayed seconds
+        self.ticker = CountdownTicker(self, lambda: self.target_dt, self.update_countdown)
+        self.ticker.start()
+        # A closed dialog sticks around until it's collected; stop its wakeups now
+        self.finished.connect(self.ticker.stop)
         self.apply_settings()
         self.sound_played = False
         # Overlay mode settings
         self.overlay_base_size = self.settings.get("countdown_overlay_size", [400, 120])
         self.overlay_base_pos = self.settings.get("countdown_overlay_pos", [200, 200])
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Back to per-second ticks (and a fresh reading) once visible again
+        self.ticker.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.ticker.start()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.ticker.start()
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.update_font_scale()
@@ -909,24 +1678,10 @@ class CountdownDialog(SnappableDialog):
         # Prioritize width scaling (allow taller text if needed)
         font_size = int(self.base_font_size * (self.width() / self.base_size[0]))
         font_size = max(int(self.base_font_size * self.min_font_scale), min(int(self.base_font_size * self.max_font_scale), font_size))
-        font = QFont("Segoe UI", font_size, QFont.Bold)
-        fm = QFontMetrics(font)
-        rect = fm.boundingRect(self.label.text())
-        # Shrink font until width fits, allow some vertical overflow
-        while rect.width() > avail_w and font_size > min_font_size:
-            font_size -= 1
-            font.setPointSize(font_size)
-            font.setWeight(QFont.Bold)
-            fm = QFontMetrics(font)
-            rect = fm.boundingRect(self.label.text())
-        # If height is still way too large, shrink a bit more, but less aggressively
-        while rect.height() > avail_h * 1.2 and font_size > min_font_size:
-            font_size -= 1
-            font.setPointSize(font_size)
-            font.setWeight(QFont.Bold)
-            fm = QFontMetrics(font)
-            rect = fm.boundingRect(self.label.text())
-        self.label.setFont(font)
+        # Shrink until width fits, allowing some vertical overflow
+        font_size = TextFitter.for_family("Segoe UI").fit(self.label.text(), font_size, min_font_size, avail_w, avail_h * 1.2)
+        if self.label.font().pointSize() != font_size:
+            self.label.setFont(QFont("Segoe UI", font_size, QFont.Bold))
         info_font = QFont("Segoe UI", int(18 * (font_size / self.base_font_size)))
         self.info.setFont(info_font)
         self.label.setAlignment(Qt.AlignCenter)
@@ -940,6 +1695,7 @@ class CountdownDialog(SnappableDialog):
             self.settings["countdown_normal_pos"] = [self.x(), self.y()]
             self.settings["countdown_normal_size"] = [self.width(), self.height()]
         save_settings(self.settings)
+        settings_store.flush()
         super().closeEvent(event)
 
     def update_countdown(self):
@@ -948,7 +1704,7 @@ class CountdownDialog(SnappableDialog):
         if delta.total_seconds() <= 0:
             self.label.setText("00:00:00")
             self.info.setText("Time reached!")
-            self.timer.stop()
+            self.ticker.stop()
             if self.settings.get("play_sound") and not self.sound_played:
                 self.play_tada()
                 self.sound_played = True
@@ -998,14 +1754,8 @@ class CountdownDialog(SnappableDialog):
         if src_idx < 0:
             return  # No valid timezone selected
         try:
-            if date_str:
-                dt = parser.parse(f"{now.year}/{date_str} {time_str}")
-            else:
-                dt = parser.parse(f"{now.year}/{now.month:02}/{now.day:02} {time_str}")
-            src_abbr, src_dst_abbr, _, _, _, src_pytz = TIMEZONES[src_idx]
-            import pytz
-            src_tz = pytz.timezone(src_pytz)
-            src_dt = src_tz.localize(dt)
+            dt = parse_input(date_str, time_str, now)
+            src_dt = localize(dt, resolve_zone(src_idx))
             local_dt = src_dt.astimezone()
             if hasattr(self, 'countdown_dialog') and self.countdown_dialog is not None:
                 try:
@@ -1042,6 +1792,7 @@ class CountdownDialog(SnappableDialog):
         self.settings["main_window_pos"] = [self.x(), self.y()]
         self.settings["main_window_size"] = [self.width(), self.height()]
         save_settings(self.settings)
+        settings_store.flush()
         super().closeEvent(event)
 
     def _handle_custom_tz(self, idx, is_src):
@@ -1055,17 +1806,15 @@ class CountdownDialog(SnappableDialog):
                     self.custom_src_offset = offset
                 else:
                     self.custom_dst_offset = offset
-                # Update dropdown label
-                sign = '+' if offset >= 0 else '-'
-                label = f"UTC{sign}{abs(offset)}"
-                combo.setItemText(combo.count()-1, label)
-                combo.setCurrentIndex(combo.count()-1)
+                # The custom row's label follows its offset
+                combo.set_custom_offset(offset)
+                combo.setCurrentIndex(combo.custom_row())
             else:
                 # If cancelled, revert selection
                 combo.setCurrentIndex(0)
 
     def play_tada(self):
-        play_custom_sound()
+        play_custom_sound(sound_name(self.settings), due=self.target_dt.timestamp())
 
     def toggle_overlay(self):
         # Save main window position before hiding
@@ -1093,15 +1842,8 @@ class CountdownDialog(SnappableDialog):
             self.update_overlay_visibility()
             if self.settings.get("double_click_overlay", False):
                 self.setMouseTracking(True)
-            self.setStyleSheet(self.theme_mgr.widget_stylesheet() + f"""
-QDialog {{
-    border-radius: 0px;
-    border: 0.5px solid rgba(255, 255, 255, 0.4);
-    padding: 8px; margin: 0px;
-    background-color: rgba(35, 39, 46, {self.settings.get('transparency', 0.5)});
-}}
-QFrame#resultBox {{ border: none; padding: 8px; margin: 0px; background: transparent; }}
-""")
+            self.setProperty("snapped", False)
+            self.setStyleSheet(self.overlay_stylesheet(self.theme_mgr.styles))
             self.setMinimumSize(200, 100)
             self.setMaximumSize(16777215, 16777215)
             # Restore overlay position and size EVERY time overlay mode is activated
@@ -1116,6 +1858,7 @@ QFrame#resultBox {{ border: none; padding: 8px; margin: 0px; background: transpa
             self.setWindowFlag(Qt.FramelessWindowHint, False)
             self.overlay_mode = False
             self.update_overlay_visibility()
+            self.setProperty("snapped", False)
             self.setStyleSheet(self.theme_mgr.widget_stylesheet())
             self.setFixedSize(*self.settings.get("countdown_normal_size", [600, 180]))
             self.setWindowOpacity(1.0)
@@ -1140,6 +1883,30 @@ QFrame#resultBox {{ border: none; padding: 8px; margin: 0px; background: transpa
                 self.move(self._pre_overlay_pos)
                 self._pre_overlay_pos = None
 
+    def overlay_stylesheet(self, styles):
+        snap_border = self.theme_mgr.accent if self.theme_mgr.theme == "light" else self.theme_mgr.button_border
+        return styles.widget + f"""
+QDialog {{
+    border-radius: 0px;
+    border: 0.5px solid rgba(255, 255, 255, 0.4);
+    padding: 8px; margin: 0px;
+    background-color: rgba(35, 39, 46, {self.settings.get('transparency', 0.5)});
+}}
+QDialog[snapped="true"] {{ border: 0.5px solid {snap_border}; border-radius: 0px; }}
+QFrame#resultBox {{ border: none; padding: 8px; margin: 0px; background: transparent; }}
+"""
+
+    def themed_stylesheet(self, styles):
+        # Theme switches keep the overlay's translucent background and snap cue
+        return self.overlay_stylesheet(styles) if self.overlay_mode else styles.widget
+
+    def set_snap_cue(self, snapped):
+        if self.property("snapped") == snapped:
+            return
+        self.setProperty("snapped", snapped)
+        self.style().unpolish(self)
+        self.style().polish(self)
+
     def mouseDoubleClickEvent(self, event):
         if self.overlay_mode and self.settings.get("double_click_overlay", False):
             self.toggle_overlay()  # disables overlay
@@ -1158,7 +1925,7 @@ QFrame#resultBox {{ border: none; padding: 8px; margin: 0px; background: transpa
 
     def update_overlay_visibility(self):
         # Hide/show power and cog buttons and info label based on overlay mode
-        borderless = "QPushButton { background: transparent; border: none; outline: none; color: %s; font-size: 28px; min-width:32px; min-height:32px; border: none; } QPushButton:pressed { background: transparent; border: none; outline: none; }" % self.theme_mgr.symbol
+        borderless = self.theme_mgr.styles.borderless
         if self.overlay_mode:
             if hasattr(self, 'overlay_btn') and self.overlay_btn:
                 self.overlay_btn.hide()
@@ -1168,10 +1935,12 @@ QFrame#resultBox {{ border: none; padding: 8px; margin: 0px; background: transpa
         else:
             if hasattr(self, 'overlay_btn') and self.overlay_btn:
                 self.overlay_btn.show()
-                self.overlay_btn.setStyleSheet(borderless)
+                if self.overlay_btn.styleSheet() != borderless:
+                    self.overlay_btn.setStyleSheet(borderless)
             if hasattr(self, 'options_btn') and self.options_btn:
                 self.options_btn.show()
-                self.options_btn.setStyleSheet(borderless)
+                if self.options_btn.styleSheet() != borderless:
+                    self.options_btn.setStyleSheet(borderless)
             self.info.setVisible(True)
 
     def show_options(self):
@@ -1184,6 +1953,12 @@ QFrame#resultBox {{ border: none; padding: 8px; margin: 0px; background: transpa
     def apply_settings(self):
         self.setWindowOpacity(self.settings.get("transparency", 0.5) if self.overlay_mode else 1.0)
         self.set_click_through(self.overlay_mode and self.settings.get("click_through", False))
+        self.prepare_sound()
+
+    def prepare_sound(self):
+        # Decode the alarm in the background now, so the deadline has nothing to load
+        if self.settings.get("play_sound"):
+            audio.prepare(sound_name(self.settings))
 
     def set_click_through(self, enable):
         if sys.platform == "win32":
@@ -1265,24 +2040,9 @@ QFrame#resultBox {{ border: none; padding: 8px; margin: 0px; background: transpa
             elif abs(cx - mid_x) <= margin:
                 self.move(mid_x - w // 2, y)
                 snapped = True
-            # PATCH: Visual snap cue (only in overlay mode)
-            if snapped:
-                if getattr(self, '_snapping_style_update', False):
-                    return
-                self._snapping_style_update = True
-                try:
-                    theme = getattr(self, 'theme', None)
-                    theme_mgr = getattr(self, 'theme_mgr', None)
-                    if theme_mgr is not None:
-                        border_color = theme_mgr.accent if theme == "light" else theme_mgr.button_border
-                        self.setStyleSheet(self.styleSheet() +
-                            f"\nQDialog {{ border: 0.5px solid {border_color}; border-radius: 0px; }}")
-                    else:
-                        print("[Snap Cue] theme_mgr is None!")
-                except Exception as e:
-                    print(f"[Snap Cue ERROR] {e}")
-                finally:
-                    self._snapping_style_update = False
+            # Visual snap cue (only in overlay mode); the rule lives in the overlay
+            # sheet, so this only flips a property and re-polishes on a change
+            self.set_snap_cue(snapped)
         finally:
             self._snapping_in_progress = False
 
@@ -1306,8 +2066,8 @@ QFrame#resultBox {{ border: none; padding: 8px; margin: 0px; background: transpa
         """Update the countdown's target datetime and refresh display."""
         self.target_dt = new_dt
         self.sound_played = False
-        self.timer.start(1000)
-        self.update_countdown()
+        self.prepare_sound()
+        self.ticker.start()
 
 class CountdownOptionsDialog(SnappableDialog):
     def __init__(self, settings, parent=None):
@@ -1322,6 +2082,7 @@ class CountdownOptionsDialog(SnappableDialog):
         self.setWindowIcon(QIcon(APP_ICON_PATH))
         self.setFixedSize(420, 260)
         self.setStyleSheet(self.theme_mgr.widget_stylesheet())
+        themed.add(self, "window")
         layout = QVBoxLayout()
         # Theme toggle row
         theme_row = QHBoxLayout()
@@ -1330,18 +2091,21 @@ class CountdownOptionsDialog(SnappableDialog):
         self.sun_btn.setStyleSheet(self.theme_mgr.button_stylesheet(symbol=True))
         self.sun_btn.setFixedWidth(32)
         self.sun_btn.clicked.connect(self.set_light_mode)
+        themed.add(self.sun_btn, "symbol")
         theme_row.addWidget(self.sun_btn)
         self.moon_btn = QPushButton("\U0001F319")  # 
         self.moon_btn.setToolTip("Switch to Dark Mode")
         self.moon_btn.setStyleSheet(self.theme_mgr.button_stylesheet(symbol=True))
         self.moon_btn.setFixedWidth(32)
         self.moon_btn.clicked.connect(self.set_dark_mode)
+        themed.add(self.moon_btn, "symbol")
         theme_row.addWidget(self.moon_btn)
         self.auto_btn = QPushButton("\U0001F5D0")  # 
         self.auto_btn.setToolTip("Auto Theme (System)")
         self.auto_btn.setStyleSheet(self.theme_mgr.button_stylesheet(symbol=True))
         self.auto_btn.setFixedWidth(32)
         self.auto_btn.clicked.connect(self.set_auto_mode)
+        themed.add(self.auto_btn, "symbol")
         theme_row.addWidget(self.auto_btn)
         theme_row.addStretch()
         layout.addLayout(theme_row)
@@ -1357,6 +2121,7 @@ class CountdownOptionsDialog(SnappableDialog):
         self.click_chk.setChecked(settings.get("click_through", False))
         self.click_chk.setStyleSheet(self.theme_mgr.button_stylesheet(toggle=True, checked=self.click_chk.isChecked()))
         self.click_chk.toggled.connect(lambda checked: self.click_chk.setStyleSheet(self.theme_mgr.button_stylesheet(toggle=True, checked=checked)))
+        themed.add(self.click_chk, "toggle")
         layout.addWidget(self.click_chk)
         self.sound_chk = QPushButton("Play annoying sound when countdown finishes")
         self.sound_chk.setCheckable(True)
@@ -1364,20 +2129,32 @@ class CountdownOptionsDialog(SnappableDialog):
         self.sound_chk.setStyleSheet(self.theme_mgr.button_stylesheet(toggle=True, checked=self.sound_chk.isChecked()))
         self.sound_chk.toggled.connect(lambda checked: self.sound_chk.setStyleSheet(self.theme_mgr.button_stylesheet(toggle=True, checked=checked)))
         self.sound_chk.clicked.connect(self.preview_sound)
+        themed.add(self.sound_chk, "toggle")
         layout.addWidget(self.sound_chk)
+        self.sound_file = sound_name(settings)
+        self.sound_file_btn = QPushButton()
+        self.sound_file_btn.setToolTip("Pick the alarm sound (looked up in the Moist folder)")
+        self.sound_file_btn.setStyleSheet(self.theme_mgr.button_stylesheet())
+        self.sound_file_btn.clicked.connect(self.choose_sound)
+        themed.add(self.sound_file_btn, "button")
+        layout.addWidget(self.sound_file_btn)
+        self.update_sound_file_btn()
         self.dblclick_chk = QPushButton("Double Click Overlay Control")
         self.dblclick_chk.setCheckable(True)
         self.dblclick_chk.setChecked(settings.get("double_click_overlay", False))
         self.dblclick_chk.setStyleSheet(self.theme_mgr.button_stylesheet(toggle=True, checked=self.dblclick_chk.isChecked()))
         self.dblclick_chk.toggled.connect(lambda checked: self.dblclick_chk.setStyleSheet(self.theme_mgr.button_stylesheet(toggle=True, checked=checked)))
+        themed.add(self.dblclick_chk, "toggle")
         layout.addWidget(self.dblclick_chk)
         btn_row = QHBoxLayout()
         ok_btn = QPushButton("OK")
         ok_btn.clicked.connect(self.accept)
         ok_btn.setStyleSheet(self.theme_mgr.button_stylesheet())
+        themed.add(ok_btn, "button")
         cancel_btn = QPushButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
         cancel_btn.setStyleSheet(self.theme_mgr.button_stylesheet())
+        themed.add(cancel_btn, "button")
         btn_row.addWidget(ok_btn)
         btn_row.addWidget(cancel_btn)
         layout.addLayout(btn_row)
@@ -1400,30 +2177,20 @@ class CountdownOptionsDialog(SnappableDialog):
     def set_auto_mode(self):
         self.settings["theme"] = "auto"
         save_settings(self.settings)
-        self.theme_mgr.set_theme(get_theme(self.settings))
+        # Don't save the resolved theme over "auto", or it stops following the system
+        self.theme_mgr.set_theme(get_theme(self.settings), save=False)
         self.setStyleSheet(self.theme_mgr.widget_stylesheet())
         self.update_all_themes()
 
     def update_all_themes(self):
-        app = QApplication.instance()
-        for w in app.topLevelWidgets():
-            if hasattr(w, "theme_mgr"):
-                theme = get_theme(self.settings)
-                w.theme_mgr.set_theme(theme)
-                w.setStyleSheet(w.theme_mgr.widget_stylesheet())
-                for attr in dir(w):
-                    obj = getattr(w, attr)
-                    if isinstance(obj, QPushButton):
-                        if hasattr(obj, "isCheckable") and obj.isCheckable():
-                            obj.setStyleSheet(w.theme_mgr.button_stylesheet(toggle=True, checked=obj.isChecked(), symbol=(obj.text() in ["", "", "", ""])) )
-                        else:
-                            obj.setStyleSheet(w.theme_mgr.button_stylesheet(symbol=(obj.text() in ["", "", "", ""])) )
+        themed.apply(get_theme(self.settings), save=self.settings.get("theme") in ("light", "dark"))
 
     def get_settings(self):
         return {
             "transparency": self.transparency_slider.value() / 100.0,
             "click_through": self.click_chk.isChecked(),
             "play_sound": self.sound_chk.isChecked(),
+            "sound_file": self.sound_file,
             "double_click_overlay": self.dblclick_chk.isChecked(),
             "theme": self.parent().theme_mgr.theme if hasattr(self.parent(), 'theme_mgr') else 'auto',
         }
@@ -1431,7 +2198,21 @@ class CountdownOptionsDialog(SnappableDialog):
     def preview_sound(self):
         # Play sound once when enabling the option
         if self.sound_chk.isChecked():
-            play_custom_sound()
+            play_custom_sound(self.sound_file)
+
+    def choose_sound(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Choose alarm sound", MOIST_DIR, "Sounds (*.ogg *.wav *.mp3)")
+        if not path:
+            return
+        # Keep files inside Moist/ relative so the folder can be moved
+        rel = os.path.relpath(path, MOIST_DIR)
+        self.sound_file = path if rel.startswith(os.pardir) or os.path.isabs(rel) else rel
+        self.update_sound_file_btn()
+        if self.sound_chk.isChecked():
+            play_custom_sound(self.sound_file)
+
+    def update_sound_file_btn(self):
+        self.sound_file_btn.setText(f"Sound: {os.path.basename(self.sound_file)}")
 
     def accept(self):
         # Save window positions and size for all relevant windows
@@ -1466,6 +2247,7 @@ class AboutDialog(SnappableDialog):
         self.theme_mgr = ThemeManager(theme)
         self.theme_mgr.settings = settings
         self.setStyleSheet(self.theme_mgr.widget_stylesheet())
+        themed.add(self, "window")
         layout = QVBoxLayout()
 
         # Message text
@@ -1494,21 +2276,18 @@ class AboutDialog(SnappableDialog):
 
         self.setLayout(layout)
 
-def play_custom_sound():
-    AUDIO_PATH = r'F:\\Programming\\Resources\\Sound\\tutuogg.ogg'
-    try:
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-        pygame.mixer.music.load(AUDIO_PATH)
-        pygame.mixer.music.play()
-    except Exception as e:
-        print(f"Failed to play sound: {e}")
+def play_custom_sound(name=DEFAULT_SOUND, due=None):
+    # Returns at once; see audio_service for loading and latency reporting
+    audio.play(name, due)
 
-if __name__ == "__main__":
-    import os
-    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
-    import pygame
+def run():
     app = QApplication(sys.argv)
+    startup.mark("qapplication")
+    # Anything still pending when the app quits without closing a window
+    app.aboutToQuit.connect(settings_store.flush)
     window = TimezoneConverter()
     window.show()
-    sys.exit(app.exec_())
+    return app.exec_()
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -1 +1,13 @@
-from main import *
+import os
+import sys
+
+# The app modules live next to this package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if sys.argv[1:2] == ["convert"]:
+    # Headless batch conversion; never touches PyQt5 or pygame
+    from cli import main
+    sys.exit(main(sys.argv[2:]))
+
+from main import run
+sys.exit(run())
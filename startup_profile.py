@@ -0,0 +1,70 @@
+"""Phase timings from process launch to the first painted main window.
+
+main.py imports this first and calls startup.mark(name) as each startup
+phase finishes; a phase's time is measured from the previous mark. If the
+launcher sets TZC_LAUNCH_TIME (time.time() just before spawning), the time
+spent bringing up the interpreter is recorded as well.
+
+Set TZC_STARTUP_REPORT to a file path to get the timings as JSON once the
+window first paints (or "-" for stdout). Add TZC_STARTUP_EXIT=1 to quit
+right after, which is what benchmarks/bench_startup.py does.
+"""
+import json
+import os
+import time
+
+LAUNCH_ENV = "TZC_LAUNCH_TIME"
+REPORT_ENV = "TZC_STARTUP_REPORT"
+EXIT_ENV = "TZC_STARTUP_EXIT"
+
+
+class StartupProfile:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = []
+        self._last = self.started
+        launched = os.environ.get(LAUNCH_ENV)
+        if launched:
+            try:
+                self.phases.append(("interpreter", max(0.0, time.time() - float(launched))))
+            except ValueError:
+                pass
+
+    def mark(self, name):
+        # Only the first time through counts; later windows reuse the code paths
+        if self.has(name):
+            return
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    def has(self, name):
+        return any(phase == name for phase, _ in self.phases)
+
+    def total(self):
+        return sum(seconds for _, seconds in self.phases)
+
+    def as_dict(self):
+        return {
+            "phases": {name: round(seconds * 1000, 3) for name, seconds in self.phases},
+            "total_ms": round(self.total() * 1000, 3),
+        }
+
+    def write_report(self):
+        # Returns True if a report was requested (and written)
+        path = os.environ.get(REPORT_ENV)
+        if not path:
+            return False
+        report = json.dumps(self.as_dict())
+        if path == "-":
+            print(report, flush=True)
+        else:
+            with open(path, "w") as f:
+                f.write(report)
+        return True
+
+    def exit_requested(self):
+        return os.environ.get(EXIT_ENV) == "1"
+
+
+startup = StartupProfile()
@@ -0,0 +1,84 @@
+"""The system's light/dark preference, read once and kept current.
+
+get_theme() used to open the Windows registry every time a window or dialog
+was built. SystemThemeWatcher probes once, hands out the cached answer, and
+on Windows keeps it current from a background thread that blocks in
+RegNotifyChangeKeyValue until the Personalize key changes (falling back to
+polling if that isn't available). Listeners are called from that thread;
+main.py relays them onto the GUI thread with a Qt signal.
+
+Other platforms have no system preference to read here, so they stay
+"light" as before and no thread is started.
+"""
+import platform
+import threading
+import time
+
+PERSONALIZE_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Themes\Personalize"
+REG_NOTIFY_CHANGE_LAST_SET = 0x4
+# Seconds between probes when change notifications can't be used
+POLL_INTERVAL = 30.0
+
+
+def probe_system_theme():
+    # Try to detect dark mode on Windows
+    if platform.system() == "Windows":
+        try:
+            import winreg
+            registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
+            key = winreg.OpenKey(registry, PERSONALIZE_KEY)
+            value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
+            return "light" if value == 1 else "dark"
+        except Exception:
+            pass
+    return "light"
+
+
+class SystemThemeWatcher:
+    def __init__(self, probe=probe_system_theme):
+        self.probe = probe
+        self.theme = None
+        self.listeners = []
+        self.thread = None
+
+    def current(self):
+        # Only the very first call probes the OS
+        if self.theme is None:
+            self.theme = self.probe()
+        return self.theme
+
+    def refresh(self):
+        theme = self.probe()
+        if theme == self.theme:
+            return False
+        self.theme = theme
+        for listener in list(self.listeners):
+            listener(theme)
+        return True
+
+    def start(self, listener):
+        self.listeners.append(listener)
+        if self.thread is None and platform.system() == "Windows":
+            self.current()
+            self.thread = threading.Thread(target=self._watch, name="theme-watcher", daemon=True)
+            self.thread.start()
+
+    def _watch(self):
+        try:
+            self._wait_for_registry_changes()
+        except Exception:
+            while True:
+                time.sleep(POLL_INTERVAL)
+                self.refresh()
+
+    def _wait_for_registry_changes(self):
+        import ctypes
+        import winreg
+        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, PERSONALIZE_KEY, 0, winreg.KEY_NOTIFY | winreg.KEY_READ)
+        notify = ctypes.windll.advapi32.RegNotifyChangeKeyValue
+        while True:
+            # Blocks until a value under the key is written
+            result = notify(ctypes.c_void_p(int(key)), False, REG_NOTIFY_CHANGE_LAST_SET, None, False)
+            if result != 0:
+                raise OSError(result, "RegNotifyChangeKeyValue failed")
+            self.refresh()
@@ -0,0 +1,54 @@
+"""Strict parsers for the date/time shapes the app produces.
+
+The GUI only ever builds "MM/DD" dates and "HH:MM" times (see date_autofmt and
+time_autofmt), and scripts mostly feed ISO-8601. Those are matched exactly
+here; anything else (half-typed input, free-form text) falls back to
+dateutil, which is only imported the first time it's needed.
+"""
+import re
+from datetime import datetime
+
+DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})")
+TIME_RE = re.compile(r"(\d{1,2}):(\d{2})(?::(\d{2}))?")
+SLASHED_RE = re.compile(r"(\d{4})/(\d{1,2})/(\d{1,2})[ T](\d{1,2}):(\d{2})(?::(\d{2}))?")
+
+
+def _dateutil_parse(text):
+    from dateutil import parser
+    return parser.parse(text)
+
+
+def parse_date_time(date_str, time_str, now=None):
+    # Date is MM/DD in the current year; an empty date means today
+    now = now or datetime.now()
+    time_match = TIME_RE.fullmatch(time_str)
+    date_match = DATE_RE.fullmatch(date_str) if date_str else None
+    if time_match and (date_match or not date_str):
+        if date_match:
+            month, day = int(date_match.group(1)), int(date_match.group(2))
+        else:
+            month, day = now.month, now.day
+        hour, minute, second = time_match.groups()
+        try:
+            return datetime(now.year, month, day, int(hour), int(minute), int(second or 0))
+        except ValueError:
+            pass  # Let dateutil produce the error message users already know
+    if date_str:
+        return _dateutil_parse(f"{now.year}/{date_str} {time_str}")
+    return _dateutil_parse(f"{now.year}/{now.month:02}/{now.day:02} {time_str}")
+
+
+def parse_datetime(text):
+    # Full timestamps: ISO-8601, "YYYY/MM/DD HH:MM[:SS]", then anything dateutil takes
+    text = text.strip()
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    m = SLASHED_RE.fullmatch(text)
+    if m:
+        try:
+            return datetime(*(int(g or 0) for g in m.groups()))
+        except ValueError:
+            pass
+    return _dateutil_parse(text)
@@ -0,0 +1,139 @@
+"""Flat UTC transition tables for fast offset lookups without pytz internals.
+
+Tables are built once per zone per process and cover a configurable range of
+years. Lookups outside that range report themselves as uncovered so callers
+can fall back to pytz.
+"""
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+EPOCH = datetime(1970, 1, 1)
+ONE_SECOND = timedelta(seconds=1)
+DAY_SECONDS = 86400
+DEFAULT_YEARS = (1900, 2037)
+
+
+def to_seconds(dt):
+    # Naive datetime -> whole seconds since the epoch (floored)
+    return (dt - EPOCH) // ONE_SECOND
+
+
+class ZoneTable:
+    """Sorted periods of one zone: start instant, UTC offset, DST flag, abbreviation.
+
+    `starts` holds the UTC instant each period begins. `walls` holds the local
+    wall-clock time at which localize() switches to that period, which mirrors
+    pytz's is_dst=False choice for both ambiguous and skipped times.
+    `tzinfos` holds the tzinfo pytz itself would attach for each period.
+    """
+    __slots__ = ("name", "starts", "walls", "offsets", "is_dst", "abbrs", "tzinfos", "valid_from", "valid_until")
+
+    def __init__(self, name, periods, valid_from=float('-inf'), valid_until=float('inf')):
+        self.name = name
+        self.starts = array('q')
+        self.walls = array('q')
+        self.offsets = array('l')
+        self.is_dst = array('b')
+        abbrs = []
+        tzinfos = []
+        for start, offset, is_dst, abbr, tz in periods:
+            self.starts.append(start)
+            self.walls.append(start + offset)
+            self.offsets.append(offset)
+            self.is_dst.append(1 if is_dst else 0)
+            abbrs.append(abbr)
+            tzinfos.append(tz)
+        self.abbrs = tuple(abbrs)
+        self.tzinfos = tuple(tzinfos)
+        self.valid_from = valid_from
+        self.valid_until = valid_until
+
+    def __len__(self):
+        return len(self.starts)
+
+    def covers_utc(self, seconds):
+        return self.valid_from <= seconds < self.valid_until
+
+    def covers_wall(self, seconds):
+        # Offsets never exceed a day, so keep a day of slack at either end
+        return self.valid_from + DAY_SECONDS <= seconds < self.valid_until - DAY_SECONDS
+
+    def index_for_utc(self, seconds):
+        return max(bisect_right(self.starts, seconds) - 1, 0)
+
+    def index_for_wall(self, seconds):
+        return max(bisect_right(self.walls, seconds) - 1, 0)
+
+    def period(self, i):
+        return self.offsets[i], bool(self.is_dst[i]), self.abbrs[i]
+
+
+def build_table(tz, years=None):
+    # Accepts any pytz zone or a fixed-offset tzinfo
+    name = getattr(tz, "zone", None) or tz.tzname(None)
+    transitions = getattr(tz, "_utc_transition_times", None)
+    if not transitions:
+        offset = tz.utcoffset(None) if hasattr(tz, "localize") else tz.utcoffset(EPOCH)
+        return ZoneTable(name, [(to_seconds(datetime.min), int(offset.total_seconds()), False, tz.tzname(None), tz)])
+    first_year, last_year = years or DEFAULT_YEARS
+    range_start = to_seconds(datetime(first_year, 1, 1))
+    range_end = to_seconds(datetime(last_year + 1, 1, 1))
+    periods = []
+    previous = None
+    trimmed = False
+    for when, info in zip(transitions, tz._transition_info):
+        start = to_seconds(when)
+        if start >= range_end:
+            break
+        # Drop no-op periods so the table stays compact
+        if info == previous:
+            continue
+        previous = info
+        offset, dst, abbr = info
+        period = (start, int(offset.total_seconds()), bool(dst), abbr, tz._tzinfos[info])
+        if start <= range_start and periods:
+            # Only the period in force at the start of the range matters
+            periods[-1] = period
+            trimmed = True
+        else:
+            periods.append(period)
+    # pytz keeps its last period forever, so a range reaching past the final
+    # transition stays exact indefinitely
+    valid_until = float('inf') if to_seconds(transitions[-1]) < range_end else range_end
+    valid_from = range_start if trimmed else float('-inf')
+    return ZoneTable(name, periods, valid_from, valid_until)
+
+
+_tables = {}
+_years = DEFAULT_YEARS
+_generation = 0
+
+
+def set_year_range(first_year, last_year):
+    global _years, _generation
+    _years = (first_year, last_year)
+    _tables.clear()
+    _generation += 1
+
+
+def generation():
+    # Bumped whenever cached tables are thrown away, so dependent caches can follow
+    return _generation
+
+
+def get_year_range():
+    return _years
+
+
+def get_table(tz):
+    key = getattr(tz, "zone", None) or repr(tz)
+    table = _tables.get(key)
+    if table is None:
+        table = _tables[key] = build_table(tz, _years)
+    return table
+
+
+def preload(zones):
+    for tz in zones:
+        get_table(tz)
@@ -0,0 +1,114 @@
+"""The current wall time in many zones, read from one UTC instant.
+
+Each zone remembers the transition-table period it is in (offset, abbreviation)
+together with the UTC window that period covers, so a reading is one
+time.time() call and, per zone, a range check and some integer arithmetic. The
+table is only consulted again when a zone crosses a DST transition.
+
+Displayed times only change on a minute boundary, so callers wake once a
+minute (see next_delay) and WorldClock.changes() reports just the fields whose
+text differs from the previous reading.
+
+Nothing here imports Qt; main.py's WorldClockPanel owns the labels.
+"""
+import time
+from datetime import date, datetime, timezone
+
+from countdown_clock import TICK_SLACK
+from transitions import get_table
+
+MINUTE = 60
+DAY_SECONDS = 86400
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# Fields of one reading, in the order changes() reports them
+FIELDS = ("time", "day", "abbr")
+
+
+def next_delay(now=None):
+    # Seconds until just after the next UTC minute boundary
+    now = time.time() if now is None else now
+    return MINUTE - now % MINUTE + TICK_SLACK
+
+
+class ZoneClock:
+    """One zone's cached period: its offset and abbreviation, valid for [start, end)."""
+    __slots__ = ("name", "tz", "table", "offset", "abbr", "start", "end", "day", "day_text")
+
+    def __init__(self, name, tz):
+        self.name = name
+        self.tz = tz
+        self.table = get_table(tz)
+        self.start = self.end = 0
+        self.day = self.day_text = None
+
+    def period(self, utc):
+        if not self.start <= utc < self.end:
+            self._load(utc)
+        return self.offset, self.abbr
+
+    def _load(self, utc):
+        table = self.table
+        if table.covers_utc(utc):
+            i = table.index_for_utc(utc)
+            self.offset, _, self.abbr = table.period(i)
+            self.start = table.starts[i] if i else table.valid_from
+            self.end = table.starts[i + 1] if i + 1 < len(table) else table.valid_until
+        else:
+            # Past the cached years: ask the zone itself, and again next minute
+            local = datetime.fromtimestamp(utc, timezone.utc).astimezone(self.tz)
+            self.offset = int(local.utcoffset().total_seconds())
+            self.abbr = local.tzname()
+            self.start = utc - utc % MINUTE
+            self.end = self.start + MINUTE
+
+    def reading(self, utc):
+        offset, abbr = self.period(utc)
+        local = utc + offset
+        day = local // DAY_SECONDS
+        if day != self.day:
+            self.day = day
+            self.day_text = date.fromordinal(EPOCH_ORDINAL + day).strftime("%a %m/%d")
+        minutes = local % DAY_SECONDS // MINUTE
+        return f"{minutes // 60:02}:{minutes % 60:02}", self.day_text, abbr
+
+
+class WorldClock:
+    """Readings for a list of zones, remembering what was last displayed."""
+    def __init__(self, zones=()):
+        self.clocks = []
+        self.shown = []
+        for name, tz in zones:
+            self.add(name, tz)
+
+    def __len__(self):
+        return len(self.clocks)
+
+    def add(self, name, tz):
+        self.clocks.append(ZoneClock(name, tz))
+        self.shown.append((None,) * len(FIELDS))
+        return len(self.clocks) - 1
+
+    def remove(self, row):
+        del self.clocks[row]
+        del self.shown[row]
+
+    def readings(self, now=None):
+        utc = int(time.time() if now is None else now)
+        return [clock.reading(utc) for clock in self.clocks]
+
+    def changes(self, now=None):
+        # (row, field, text) for every field that differs from the last call
+        changed = []
+        for row, reading in enumerate(self.readings(now)):
+            shown = self.shown[row]
+            if reading == shown:
+                continue
+            for field, text, old in zip(FIELDS, reading, shown):
+                if text != old:
+                    changed.append((row, field, text))
+            self.shown[row] = reading
+        return changed
+
+    def forget(self):
+        # Next changes() reports everything, e.g. after the labels were rebuilt
+        self.shown = [(None,) * len(FIELDS) for _ in self.clocks]
@@ -0,0 +1,163 @@
+"""Every IANA zone pytz knows, with a prefix index for type-to-filter search.
+
+Each zone is indexed under its city and region words ("buenos", "aires",
+"america"), the abbreviations it uses in January and July ("ist", "est",
+"edt") and its UTC offsets in the shapes people type ("+5:30", "utc+5:30",
+"+0530", "+5"). Every prefix of every token maps to the zones carrying it, so
+a query is one dict lookup per word plus a set intersection, and ranking only
+looks at the zones that matched.
+
+Loading ~600 zone files through pytz takes a couple of hundred milliseconds,
+so nothing is built (or even imported) until the picker first opens, and the
+per-zone metadata is cached on disk keyed on the pytz version so later
+launches skip it.
+"""
+import heapq
+import json
+import os
+import re
+from collections import namedtuple
+from datetime import datetime
+
+from engine import TIMEZONES
+
+ZoneEntry = namedtuple("ZoneEntry", "name region city abbrs offsets featured")
+
+# How many ranked results a query returns
+MAX_RESULTS = 100
+WORD_RE = re.compile(r"[^\W_]+")
+
+
+def offset_text(minutes, colon=True):
+    sign = "+" if minutes >= 0 else "-"
+    hours, mins = divmod(abs(minutes), 60)
+    return f"{sign}{hours:02}:{mins:02}" if colon else f"{sign}{hours:02}{mins:02}"
+
+
+def offset_tokens(minutes):
+    sign = "+" if minutes >= 0 else "-"
+    hours, mins = divmod(abs(minutes), 60)
+    short = f"{sign}{hours}:{mins:02}" if mins else f"{sign}{hours}"
+    tokens = {offset_text(minutes), offset_text(minutes, colon=False), short}
+    return tokens | {prefix + t for t in tokens for prefix in ("utc", "gmt")}
+
+
+def describe_zone(name, year):
+    # Abbreviations and offsets in January and July, which covers both sides of DST
+    import pytz
+    tz = pytz.timezone(name)
+    abbrs, offsets = [], []
+    for month in (1, 7):
+        local = tz.localize(datetime(year, month, 15, 12), is_dst=False)
+        abbrs.append(local.tzname())
+        offsets.append(int(local.utcoffset().total_seconds() // 60))
+    return abbrs, offsets
+
+
+def build_entries(names, year=None):
+    year = year or datetime.now().year
+    featured = {row[5] for row in TIMEZONES}
+    entries = []
+    for name in names:
+        abbrs, offsets = describe_zone(name, year)
+        parts = name.split("/")
+        region = parts[0] if len(parts) > 1 else ""
+        city = parts[-1].replace("_", " ")
+        entries.append(ZoneEntry(name, region, city,
+                                 tuple(dict.fromkeys(abbrs)), tuple(dict.fromkeys(offsets)),
+                                 name in featured))
+    return entries
+
+
+class ZoneCatalog:
+    def __init__(self, entries):
+        self.entries = entries
+        self.by_name = {entry.name: i for i, entry in enumerate(entries)}
+        self.prefixes = {}
+        self.tokens = []
+        self.city_words = []
+        for i, entry in enumerate(entries):
+            words = [w.lower() for w in WORD_RE.findall(entry.name)]
+            self.city_words.append([w.lower() for w in WORD_RE.findall(entry.city)])
+            tokens = set(words) | {entry.name.lower(), entry.city.lower()}
+            tokens.update(abbr.lower() for abbr in entry.abbrs)
+            for minutes in entry.offsets:
+                tokens.update(offset_tokens(minutes))
+            self.tokens.append(tokens)
+            for token in tokens:
+                for end in range(1, len(token) + 1):
+                    self.prefixes.setdefault(token[:end], set()).add(i)
+        # Empty query: the app's own zones first, then the rest by name
+        self.default_order = sorted(range(len(entries)), key=lambda i: (not entries[i].featured, entries[i].name))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def label(self, entry):
+        offsets = " / ".join(offset_text(m) for m in entry.offsets)
+        return f"{entry.name}  (UTC{offsets}, {'/'.join(entry.abbrs)})"
+
+    def search(self, query, limit=MAX_RESULTS):
+        terms = query.lower().split()
+        if not terms:
+            return [self.entries[i] for i in self.default_order[:limit]]
+        matches = None
+        for term in terms:
+            ids = self.prefixes.get(term)
+            if not ids:
+                return []
+            matches = set(ids) if matches is None else matches & ids
+            if not matches:
+                return []
+        ranked = heapq.nsmallest(limit, matches, key=lambda i: self._rank(i, terms))
+        return [self.entries[i] for i in ranked]
+
+    def _rank(self, i, terms):
+        # Whole-word matches first, then a hit on the city, the app's own zones,
+        # and shorter (usually canonical) names
+        entry = self.entries[i]
+        exact = sum(1 for t in terms if t in self.tokens[i])
+        city_hit = any(w.startswith(t) for t in terms for w in self.city_words[i])
+        return (-exact, not city_hit, not entry.featured, len(entry.name), entry.name)
+
+
+def catalog_cache_key():
+    import pytz
+    return [pytz.__version__, datetime.now().year]
+
+
+def load_catalog(cache_path=None):
+    entries = None
+    if cache_path:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("key") == catalog_cache_key():
+                entries = [ZoneEntry(name, region, city, tuple(abbrs), tuple(offsets), featured)
+                           for name, region, city, abbrs, offsets, featured in cached["entries"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            entries = None
+    if entries is None:
+        import pytz
+        entries = build_entries(pytz.all_timezones)
+        if cache_path:
+            # Written to a temp file and renamed, so a crash can't leave half a cache
+            tmp_path = cache_path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"key": catalog_cache_key(), "entries": entries}, f)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass
+    return ZoneCatalog(entries)
+
+
+_catalog = None
+
+
+def get_catalog(cache_path=None):
+    # Built on first use, then shared for the life of the process
+    global _catalog
+    if _catalog is None:
+        _catalog = load_catalog(cache_path)
+    return _catalog
@@ -0,0 +1,163 @@
+"""Pick the TIMEZONES row that best matches the system's local zone.
+
+Matching order, same as the main window always used:
+  1. the system zone names a TIMEZONES row outright (IANA name or label text)
+  2. rows sharing the system's current UTC offset, ranked by how well they
+     match the locale's region, in timezone_offset_map.json order first
+
+The index behind this is built once, and the answer is cached in Moist/
+keyed on what the OS reports about its zone (TZ, /etc/localtime, tzname and
+current offset) plus the locale, so later launches skip detection, and the
+tzlocal and pytz imports, entirely.
+"""
+import json
+import locale
+import os
+import time
+import zlib
+from datetime import datetime, timezone
+
+from engine import TIMEZONES
+
+
+def offset_str(offset):
+    total_minutes = int(offset.total_seconds() // 60)
+    sign = '+' if total_minutes >= 0 else '-'
+    hours, minutes = divmod(abs(total_minutes), 60)
+    return f"{sign}{hours:02}:{minutes:02}"
+
+
+def zone_label(row):
+    abbr, dst_abbr, _, _, loc_name, _ = row
+    return f"{abbr} / {dst_abbr} ({loc_name})"
+
+
+def system_locale():
+    # Use getlocale() and fall back to the environment if needed
+    loc = locale.getlocale()
+    if (not loc or not loc[0]) and hasattr(locale, 'getdefaultlocale'):
+        loc = locale.getdefaultlocale()
+    if not loc or not loc[0]:
+        for env in (os.environ.get('LANG'), os.environ.get('LC_ALL'), os.environ.get('LC_CTYPE')):
+            if env and '_' in env:
+                return env
+        return None
+    return loc[0]
+
+
+def locale_region(loc):
+    # e.g. 'en_ZA' -> 'ZA'
+    return loc.split('_')[-1].split('.')[0] if loc else None
+
+
+class ZoneIndex:
+    """Dict lookups from IANA name, label and UTC offset to TIMEZONES rows.
+
+    Combo boxes list TIMEZONES in order, so a row number is also the combo
+    index to select.
+    """
+    def __init__(self, timezones=TIMEZONES, offset_map=None, now=None):
+        import pytz
+        now = now or datetime.now(timezone.utc)
+        self.by_name = {}
+        self.labels = []
+        self.region_keys = []
+        self.by_offset = {}
+        for row, entry in enumerate(timezones):
+            pytz_name, loc_name = entry[5], entry[4]
+            self.by_name.setdefault(pytz_name, row)
+            self.labels.append(zone_label(entry))
+            self.region_keys.append((pytz_name.lower(), loc_name.lower()))
+            current = now.astimezone(pytz.timezone(pytz_name)).utcoffset()
+            self.by_offset.setdefault(offset_str(current), []).append(row)
+        # The offset map lists preferred zones per offset; keep only ones we can
+        # select, in the map's order, ahead of any other row at that offset
+        self.preferred = {}
+        for offset, zones in (offset_map or {}).items():
+            rows = [self.by_name[z] for z in zones if z in self.by_name]
+            if rows:
+                self.preferred[offset] = rows
+
+    def match_name(self, local_tz):
+        row = self.by_name.get(local_tz)
+        if row is not None:
+            return row
+        # Legacy names such as "Japan" or "UTC" match the dropdown label
+        spaced = local_tz.replace('_', ' ')
+        for row, label in enumerate(self.labels):
+            if local_tz in label or spaced in label:
+                return row
+        return None
+
+    def candidates(self, offset):
+        rows = list(self.preferred.get(offset, ()))
+        rows += [row for row in self.by_offset.get(offset, ()) if row not in rows]
+        return rows
+
+    def region_score(self, row, region):
+        # 0 = region in zone name, 1 = region in label, 2 = no match
+        if region:
+            pytz_name, loc_name = self.region_keys[row]
+            if region.lower() in pytz_name:
+                return 0
+            if region.lower() in loc_name:
+                return 1
+        return 2
+
+    def detect(self, local_tz, offset, region=None):
+        row = self.match_name(local_tz)
+        if row is not None:
+            return row
+        rows = self.candidates(offset)
+        if not rows:
+            return None
+        return min(rows, key=lambda r: self.region_score(r, region)) if region else rows[0]
+
+
+def load_offset_map(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def timezones_fingerprint():
+    # Invalidates cached answers when the TIMEZONES list changes
+    return zlib.crc32("|".join(row[5] for row in TIMEZONES).encode())
+
+
+def system_zone_signature():
+    # Cheap to read and changes whenever the system zone or its DST state does
+    localtime = "/etc/localtime"
+    return [os.environ.get("TZ"),
+            os.path.realpath(localtime) if os.path.exists(localtime) else None,
+            list(time.tzname),
+            time.localtime().tm_gmtoff]
+
+
+def detect_local_row(offset_db_path, cache_path):
+    loc = system_locale()
+    key = [system_zone_signature(), loc, timezones_fingerprint()]
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            return cached.get("row")
+    except (OSError, ValueError, AttributeError):
+        pass
+    import pytz
+    import tzlocal
+    local_tz = tzlocal.get_localzone_name()
+    offset = offset_str(datetime.now(pytz.timezone(local_tz)).utcoffset())
+    index = ZoneIndex(offset_map=load_offset_map(offset_db_path))
+    row = index.detect(local_tz, offset, locale_region(loc))
+    # Written to a temp file and renamed, so a crash can't leave half a cache
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"key": key, "row": row}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return row